@@ -407,6 +407,19 @@ def _save(data: dict) -> None:
 # Repo list helpers
 # ---------------------------------------------------------------------------
 
+# Last repo list read or written, with the (mtime_ns, size) of config.json
+# it matches.  load_repos() re-parses the file only when that changes.
+_repos_cache: tuple[tuple[int, int], list[dict]] | None = None
+
+
+def _config_stamp() -> tuple[int, int] | None:
+    try:
+        st = _config_path().stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_repos() -> list[dict]:
     """Return the list of configured repo dicts.
 
@@ -415,15 +428,28 @@ def load_repos() -> list[dict]:
       "name"         – optional display name
       "ssh_identity" – optional path to SSH key
       "ssl_verify"   – optional bool (default True); set False for self-signed certs
+
+    The parsed list is cached until ``config.json`` changes on disk; callers
+    get their own copies and may modify them freely.
     """
-    return _load().get("repos", [])
+    global _repos_cache
+    stamp = _config_stamp()
+    if stamp is None or _repos_cache is None or _repos_cache[0] != stamp:
+        repos = _load().get("repos", [])
+        if stamp is None:
+            return repos
+        _repos_cache = (stamp, repos)
+    return [dict(r) for r in _repos_cache[1]]
 
 
 def save_repos(repos: list[dict]) -> None:
     """Persist the repo list, preserving other config keys."""
+    global _repos_cache
     cfg = _load()
     cfg["repos"] = repos
     _save(cfg)
+    stamp = _config_stamp()
+    _repos_cache = (stamp, [dict(r) for r in repos]) if stamp is not None else None
 
 
 # ---------------------------------------------------------------------------
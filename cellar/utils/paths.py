@@ -134,9 +134,13 @@ def _detect_cow(path: Path | str, dev: int) -> bool:
     return False
 
 
+# Resolved once; the home directory doesn't change while the app runs.
+_HOME = os.path.expanduser("~")
+
+
 def short_path(path) -> str:
     """Return *path* with the home directory replaced by ``~``."""
-    return str(path).replace(os.path.expanduser("~"), "~", 1)
+    return str(path).replace(_HOME, "~", 1) if _HOME else str(path)
 
 
 def to_win32_path(abs_path: str, drive_c: str) -> str:
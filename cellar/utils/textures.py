@@ -0,0 +1,217 @@
+"""``Gdk.Texture`` loading helpers for runtime image display.
+
+Images are decoded at roughly the size they are shown at rather than at the
+file's full resolution, so a large cover or screenshot doesn't cost a
+full-resolution decode and GPU upload just to be drawn a few hundred pixels
+wide.  :func:`load_scaled_texture` is safe to call from a worker thread;
+the cached :func:`get_texture` / :func:`request_texture` are main-thread
+only and share one LRU across the browse and detail views.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import gi
+
+gi.require_version("Gdk", "4.0")
+gi.require_version("GdkPixbuf", "2.0")
+from gi.repository import Gdk, GdkPixbuf, GLib  # noqa: E402
+
+log = logging.getLogger(__name__)
+
+
+def load_scaled_texture(
+    path: str, width: int, height: int, *, cover: bool = False,
+) -> Gdk.Texture | None:
+    """Decode *path* into a texture sized for a *width* × *height* slot.
+
+    Dimensions are in device pixels (multiply by the widget's scale factor).
+    A dimension of ``0`` leaves that axis unconstrained.  With *cover* the
+    image is scaled to fill the slot (the widget crops, e.g. with
+    ``Gtk.ContentFit.COVER``); otherwise it is scaled to fit inside it.
+    Images never get upscaled — small files are loaded at native size.
+
+    Returns ``None`` if the file is missing or cannot be decoded.
+    """
+    try:
+        fmt, src_w, src_h = GdkPixbuf.Pixbuf.get_file_info(path)
+        if fmt is None or not src_w or not src_h:
+            return Gdk.Texture.new_from_filename(path)
+        ratios = [
+            dst / src for dst, src in ((width, src_w), (height, src_h)) if dst > 0
+        ]
+        if not ratios:
+            return Gdk.Texture.new_from_filename(path)
+        ratio = max(ratios) if cover else min(ratios)
+        if ratio >= 1:
+            return Gdk.Texture.new_from_filename(path)
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+            path, max(1, round(src_w * ratio)), max(1, round(src_h * ratio)), False,
+        )
+        return Gdk.Texture.new_for_pixbuf(pixbuf)
+    except GLib.Error as exc:
+        log.debug("Could not load image %s: %s", path, exc)
+        return None
+
+
+def display_scale() -> int:
+    """Return the highest scale factor among the connected monitors.
+
+    For sizing textures built before their widget is realized, when
+    ``Gtk.Widget.get_scale_factor()`` still reports ``1``.
+    """
+    display = Gdk.Display.get_default()
+    if display is None:
+        return 1
+    monitors = display.get_monitors()
+    scales = [monitors.get_item(i).get_scale_factor() for i in range(monitors.get_n_items())]
+    return max(scales, default=1)
+
+
+# ---------------------------------------------------------------------------
+# Texture cache
+# ---------------------------------------------------------------------------
+
+# Decoded textures, keyed by (path, mtime_ns, width, height, cover).  Card
+# rebuilds and re-opened detail pages hit this instead of re-decoding from
+# disk.  Including the mtime means an asset replaced on disk is picked up
+# on its next use.  Only touched from the main thread.
+#
+# The limit is on decoded bytes rather than entries: a 2× capsule cover is
+# ~1 MB and a 2× screenshot several, so a count limit says little about the
+# memory the cache pins.
+_TEXTURE_CACHE: OrderedDict[tuple[str, int, int, int, bool], Gdk.Texture] = OrderedDict()
+_TEXTURE_CACHE_BUDGET = 96 * 1024 * 1024
+_texture_cache_bytes = 0
+
+# Every cached texture is also indexed weakly, so a texture still shown
+# somewhere is found again even after the LRU dropped it.  Large images
+# that are only worth keeping while on screen (detail screenshots) live
+# here alone and are freed once every view lets go of them.
+_WEAK_TEXTURES: weakref.WeakValueDictionary[
+    tuple[str, int, int, int, bool], Gdk.Texture
+] = weakref.WeakValueDictionary()
+
+# Decoding runs on a small pool so scrolling and typing stay responsive
+# while a freshly loaded catalogue fills in its images.
+_IMG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cellar-img")
+
+
+def _cache_key(
+    path: str, width: int, height: int, cover: bool,
+) -> tuple[str, int, int, int, bool] | None:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return (path, mtime, width, height, cover)
+
+
+def _cache_get(key: tuple[str, int, int, int, bool]) -> Gdk.Texture | None:
+    texture = _TEXTURE_CACHE.get(key)
+    if texture is not None:
+        _TEXTURE_CACHE.move_to_end(key)
+        return texture
+    return _WEAK_TEXTURES.get(key)
+
+
+def _texture_bytes(texture: Gdk.Texture) -> int:
+    return texture.get_width() * texture.get_height() * 4
+
+
+def _cache_put(
+    key: tuple[str, int, int, int, bool], texture: Gdk.Texture, *, weak: bool = False,
+) -> None:
+    global _texture_cache_bytes
+    _WEAK_TEXTURES[key] = texture
+    if weak:
+        return
+    old = _TEXTURE_CACHE.pop(key, None)
+    if old is not None:
+        _texture_cache_bytes -= _texture_bytes(old)
+    _TEXTURE_CACHE[key] = texture
+    _texture_cache_bytes += _texture_bytes(texture)
+    # Evict least recently used entries until back under budget, but always
+    # keep the texture just added even if it alone exceeds the budget.
+    while _texture_cache_bytes > _TEXTURE_CACHE_BUDGET and len(_TEXTURE_CACHE) > 1:
+        _, evicted = _TEXTURE_CACHE.popitem(last=False)
+        _texture_cache_bytes -= _texture_bytes(evicted)
+
+
+def get_texture(
+    path: str, width: int, height: int, *, cover: bool = False,
+) -> Gdk.Texture | None:
+    """Return the cached texture for *path*, decoding it inline on a miss.
+
+    For small images where a placeholder would only flash; prefer
+    :func:`request_texture` for anything large.
+    """
+    key = _cache_key(path, width, height, cover)
+    if key is None:
+        return None
+    texture = _cache_get(key)
+    if texture is None:
+        texture = load_scaled_texture(path, width, height, cover=cover)
+        if texture is not None:
+            _cache_put(key, texture)
+    return texture
+
+
+def request_texture(
+    path: str,
+    width: int,
+    height: int,
+    on_ready: Callable[[Gdk.Texture], None],
+    *,
+    cover: bool = False,
+    on_error: Callable[[], None] | None = None,
+    weak: bool = False,
+) -> None:
+    """Deliver the texture for *path* at *width*×*height* to *on_ready*.
+
+    Sizes are device pixels; see :func:`load_scaled_texture`.  Cache hits
+    are delivered synchronously; misses are decoded on ``_IMG_POOL`` and
+    delivered on the main thread.  If the file is missing or cannot be
+    decoded, *on_ready* is not called; *on_error* is, when given.
+
+    With *weak* the texture is kept out of the LRU and only stays cached
+    while something else holds it; use it for large images that are
+    released as soon as they leave the screen.
+    """
+    key = _cache_key(path, width, height, cover)
+    if key is None:
+        if on_error is not None:
+            on_error()
+        return
+    texture = _cache_get(key)
+    if texture is not None:
+        on_ready(texture)
+        return
+
+    def _install(texture: Gdk.Texture | None) -> bool:
+        if texture is not None:
+            _cache_put(key, texture, weak=weak)
+            on_ready(texture)
+        elif on_error is not None:
+            on_error()
+        return False
+
+    def _done(future: Future[Gdk.Texture | None]) -> None:
+        # load_scaled_texture only handles GLib.Error; anything else would
+        # otherwise be swallowed by the executor and never reach on_error.
+        exc = future.exception()
+        if exc is not None:
+            log.warning("Could not load image %s: %s", path, exc)
+            GLib.idle_add(_install, None)
+        else:
+            GLib.idle_add(_install, future.result())
+
+    _IMG_POOL.submit(
+        load_scaled_texture, path, width, height, cover=cover,
+    ).add_done_callback(_done)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
-import os
 import threading
-from typing import Callable
+from typing import Callable, Iterator
 
 import gi
 
@@ -16,17 +16,20 @@ from gi.repository import Adw, Gdk, GLib, GObject, Gtk, Pango
 
 from cellar.models.app_entry import AppEntry
 from cellar.utils import natural_sort_key
+from cellar.utils.textures import request_texture
 from cellar.views.widgets import (
     CAPSULE_HEIGHT,
     CAPSULE_WIDTH,
     CARD_HEIGHT,
     CARD_WIDTH,
+    FALLBACK_APP_GICON,
     ICON_MARGIN,
     ICON_SIZE,
     BaseCard,
     FixedBox,
+    TextureBox,
     make_app_grid,
-    make_card_icon_from_name,
+    make_card_icon_from_gicon,
     set_margins,
 )
 
@@ -41,6 +44,9 @@ _ICON_MARGIN = ICON_MARGIN
 _CAPSULE_WIDTH = CAPSULE_WIDTH
 _CAPSULE_HEIGHT = CAPSULE_HEIGHT
 
+# Cards built per main-loop iteration when populating the grid.
+_BUILD_CHUNK = 50
+
 
 # ---------------------------------------------------------------------------
 # AppCard
@@ -67,16 +73,23 @@ class AppCard(BaseCard):
         if icon_path is None and resolve_asset and entry.icon:
             icon_path = resolve_asset(entry.icon)
 
-        if icon_path and os.path.isfile(icon_path):
-            pic = Gtk.Picture.new_for_filename(icon_path)
-            pic.set_content_fit(Gtk.ContentFit.SCALE_DOWN)
+        # The icon itself is only decoded while the card is scrolled into
+        # view (see BrowseView._update_cards_in_view); otherwise the slot
+        # shows the generic fallback so layout is final immediately.
+        self._icon_path = icon_path
+        self._img_area: FixedBox | None = None
+        self._in_view = False
+        if icon_path:
             img_area = FixedBox(ICON_SIZE, ICON_SIZE)
             img_area.set_margin_start(ICON_MARGIN)
             img_area.set_valign(Gtk.Align.CENTER)
-            img_area.set_child(pic)
+            self._placeholder = Gtk.Image.new_from_gicon(FALLBACK_APP_GICON)
+            self._placeholder.set_pixel_size(ICON_SIZE)
+            img_area.set_child(self._placeholder)
+            self._img_area = img_area
             icon_widget = img_area
         else:
-            icon_widget = make_card_icon_from_name("application-x-executable")
+            icon_widget = make_card_icon_from_gicon(FALLBACK_APP_GICON)
 
         # Build summary subtitle with word wrap
         summary = entry.summary or ""
@@ -84,6 +97,12 @@ class AppCard(BaseCard):
         super().__init__(name=entry.name, subtitle=summary, icon_widget=icon_widget)
         self.entry = entry
         self.repo_uris: set[str] = repo_uris or set()
+        # Filter fields flattened onto the card so matches() (called per
+        # card on every filter change) avoids entry lookups and set() copies.
+        self._category = entry.category
+        self._platform = entry.platform
+        self._genres = frozenset(entry.genres)
+        self._name_lc = entry.name.lower()
         self._publish_overlay: Gtk.Box | None = None
 
         # Summary needs word wrap — replace the default single-line label
@@ -102,6 +121,21 @@ class AppCard(BaseCard):
             check.add_css_class("success")
             self._overlay.add_overlay(check)
 
+    def set_in_view(self, in_view: bool) -> None:
+        """Load the icon as the card scrolls into view; drop it when it leaves."""
+        if self._img_area is None or in_view == self._in_view:
+            return
+        self._in_view = in_view
+        if in_view:
+            size = ICON_SIZE * self.get_scale_factor()
+            request_texture(self._icon_path, size, size, self._set_icon_texture)
+        else:
+            self._img_area.set_child(self._placeholder)
+
+    def _set_icon_texture(self, texture: Gdk.Texture) -> None:
+        if self._in_view:
+            self._img_area.set_child(TextureBox(ICON_SIZE, ICON_SIZE, texture))
+
     def set_publishing(self, active: bool) -> None:
         """Show or hide a spinner overlay indicating a background publish."""
         if active and self._publish_overlay is None:
@@ -131,19 +165,21 @@ class AppCard(BaseCard):
         active_genres: set[str] | None = None,
         active_platforms: set[str] | None = None,
     ) -> bool:
-        """Return True if this card should be visible given the current filter."""
-        if active_repos and not self.repo_uris & active_repos:
+        """Return True if this card should be visible given the current filter.
+
+        *search* must already be lower-cased.
+        """
+        # Cheapest membership tests first so most rejects skip the rest.
+        if active_categories and self._category not in active_categories:
             return False
-        if active_categories and self.entry.category not in active_categories:
+        if active_platforms and self._platform not in active_platforms:
             return False
-        if active_genres and not (set(self.entry.genres) & active_genres):
+        if search and search not in self._name_lc:
             return False
-        if active_platforms and self.entry.platform not in active_platforms:
+        if active_genres and self._genres.isdisjoint(active_genres):
+            return False
+        if active_repos and self.repo_uris.isdisjoint(active_repos):
             return False
-        if search:
-            needle = search.lower()
-            if needle not in self.entry.name.lower():
-                return False
         return True
 
 
@@ -174,6 +210,31 @@ def _ensure_scrim_css() -> None:
     )
 
 
+# Above this many cards the per-card drop shadow is dropped (except on
+# hover): at hundreds of cards it is a noticeable per-frame render cost.
+_FLAT_CARDS_THRESHOLD = 200
+
+_flat_cards_css_provider: Gtk.CssProvider | None = None
+
+
+def _ensure_flat_cards_css() -> None:
+    """Register the large-catalogue flat-card CSS once."""
+    global _flat_cards_css_provider
+    if _flat_cards_css_provider is not None:
+        return
+    _flat_cards_css_provider = Gtk.CssProvider()
+    _flat_cards_css_provider.load_from_string(
+        ".flat-cards .card:not(:hover) {"
+        "  box-shadow: none;"
+        "}"
+    )
+    Gtk.StyleContext.add_provider_for_display(
+        Gdk.Display.get_default(),
+        _flat_cards_css_provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
+
+
 # Module-level CSS for the capsule name overlay gradient.
 _capsule_css_provider: Gtk.CssProvider | None = None
 
@@ -201,6 +262,13 @@ def _ensure_capsule_css() -> None:
     )
 
 
+_PLATFORM_ICONS = {
+    "windows": "grid-large-symbolic",
+    "linux": "penguin-alt-symbolic",
+    "dos": "floppy-symbolic",
+}
+
+
 class CapsuleCard(Gtk.FlowBoxChild):
     """A portrait cover-art card for the capsule display mode.
 
@@ -221,6 +289,10 @@ class CapsuleCard(Gtk.FlowBoxChild):
         super().__init__()
         self.entry = entry
         self.repo_uris: set[str] = repo_uris or set()
+        self._category = entry.category
+        self._platform = entry.platform
+        self._genres = frozenset(entry.genres)
+        self._name_lc = entry.name.lower()
         self.add_css_class("app-card-cell")
 
         set_margins(self, 6)
@@ -234,48 +306,9 @@ class CapsuleCard(Gtk.FlowBoxChild):
         cover_path = asset_path
         if cover_path is None and resolve_asset and entry.cover:
             cover_path = resolve_asset(entry.cover)
-        cover_shown = False
-        if cover_path and os.path.isfile(cover_path):
-            pic = Gtk.Picture.new_for_filename(cover_path)
-            pic.set_content_fit(Gtk.ContentFit.COVER)
-            img_box = _FixedBox(_CAPSULE_WIDTH, _CAPSULE_HEIGHT)
-            img_box.set_child(pic)
-            overlay.set_child(img_box)
-            cover_shown = True
-
-        if not cover_shown:
-            # Fallback: dimmed platform icon + title on a card background.
-            _platform_icons = {
-                "windows": "grid-large-symbolic",
-                "linux": "penguin-alt-symbolic",
-                "dos": "floppy-symbolic",
-            }
-            fallback = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-            fallback.set_valign(Gtk.Align.CENTER)
-            fallback.set_halign(Gtk.Align.CENTER)
-
-            icon = Gtk.Image.new_from_icon_name(
-                _platform_icons.get(entry.platform, "grid-large-symbolic"),
-            )
-            icon.set_pixel_size(64)
-            icon.set_halign(Gtk.Align.CENTER)
-            icon.add_css_class("dim-label")
-            fallback.append(icon)
-
-            fb_label = Gtk.Label(label=entry.name)
-            fb_label.add_css_class("heading")
-            fb_label.set_halign(Gtk.Align.CENTER)
-            fb_label.set_ellipsize(Pango.EllipsizeMode.END)
-            fb_label.set_max_width_chars(16)
-            fb_label.set_lines(2)
-            fb_label.set_wrap(True)
-            fb_label.set_wrap_mode(Pango.WrapMode.WORD_CHAR)
-            fallback.append(fb_label)
-
-            fb_box = _FixedBox(_CAPSULE_WIDTH, _CAPSULE_HEIGHT, clip=False)
-            fb_box.add_css_class("activatable")
-            fb_box.set_child(fallback)
-            overlay.set_child(fb_box)
+        self._platform_icon = _PLATFORM_ICONS.get(entry.platform, "grid-large-symbolic")
+        self._fallback: _FixedBox | None = None
+        self._cover_failed = False
 
         # ── Bottom overlay: name bar on hover ─────────────────────────
         name_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -315,6 +348,67 @@ class CapsuleCard(Gtk.FlowBoxChild):
         fixed.set_child(overlay)
         self.set_child(fixed)
 
+        # Cards with a cover stay an empty card until it is decoded (see
+        # set_in_view); the icon + name fallback is only built for cards
+        # without one, or whose cover turns out to be unreadable.
+        self._cover_path = cover_path
+        self._in_view = False
+        if not cover_path:
+            self._show_fallback()
+
+    def set_in_view(self, in_view: bool) -> None:
+        """Swap in the cover as the card scrolls into view; drop it when it leaves."""
+        if not self._cover_path or self._cover_failed or in_view == self._in_view:
+            return
+        self._in_view = in_view
+        if in_view:
+            scale = self.get_scale_factor()
+            request_texture(
+                self._cover_path, _CAPSULE_WIDTH * scale, _CAPSULE_HEIGHT * scale,
+                self._set_cover_texture, cover=True, on_error=self._on_cover_failed,
+            )
+        else:
+            self._overlay.set_child(None)
+
+    def _set_cover_texture(self, texture: Gdk.Texture) -> None:
+        if self._in_view:
+            self._overlay.set_child(
+                TextureBox(_CAPSULE_WIDTH, _CAPSULE_HEIGHT, texture, cover=True),
+            )
+
+    def _on_cover_failed(self) -> None:
+        self._cover_failed = True
+        self._show_fallback()
+
+    def _show_fallback(self) -> None:
+        """Show a centred platform icon + name in place of the cover."""
+        if self._fallback is None:
+            fallback = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+            fallback.set_valign(Gtk.Align.CENTER)
+            fallback.set_halign(Gtk.Align.CENTER)
+
+            icon = Gtk.Image.new_from_icon_name(self._platform_icon)
+            icon.set_pixel_size(64)
+            icon.set_halign(Gtk.Align.CENTER)
+            icon.add_css_class("dim-label")
+            fallback.append(icon)
+
+            fb_label = Gtk.Label(label=self.entry.name)
+            fb_label.add_css_class("heading")
+            fb_label.set_halign(Gtk.Align.CENTER)
+            fb_label.set_ellipsize(Pango.EllipsizeMode.END)
+            fb_label.set_max_width_chars(16)
+            fb_label.set_lines(2)
+            fb_label.set_wrap(True)
+            fb_label.set_wrap_mode(Pango.WrapMode.WORD_CHAR)
+            fallback.append(fb_label)
+
+            fb_box = _FixedBox(_CAPSULE_WIDTH, _CAPSULE_HEIGHT, clip=False)
+            fb_box.add_css_class("activatable")
+            fb_box.set_child(fallback)
+            self._fallback = fb_box
+        self._overlay.set_child(self._fallback)
+
     def set_publishing(self, active: bool) -> None:
         """Show or hide a spinner overlay indicating a background publish."""
         if active and self._publish_overlay is None:
@@ -345,19 +439,21 @@ class CapsuleCard(Gtk.FlowBoxChild):
         active_genres: set[str] | None = None,
         active_platforms: set[str] | None = None,
     ) -> bool:
-        """Return True if this card should be visible given the current filter."""
-        if active_repos and not self.repo_uris & active_repos:
+        """Return True if this card should be visible given the current filter.
+
+        *search* must already be lower-cased.
+        """
+        # Cheapest membership tests first so most rejects skip the rest.
+        if active_categories and self._category not in active_categories:
             return False
-        if active_categories and self.entry.category not in active_categories:
+        if active_platforms and self._platform not in active_platforms:
             return False
-        if active_genres and not (set(self.entry.genres) & active_genres):
+        if search and search not in self._name_lc:
             return False
-        if active_platforms and self.entry.platform not in active_platforms:
+        if active_genres and self._genres.isdisjoint(active_genres):
+            return False
+        if active_repos and self.repo_uris.isdisjoint(active_repos):
             return False
-        if search:
-            needle = search.lower()
-            if needle not in self.entry.name.lower():
-                return False
         return True
 
 
@@ -390,11 +486,15 @@ class BrowseView(Gtk.Box):
         self._active_genres: set[str] = set()
         self._active_platforms: set[str] = set()
         self._search_text: str = ""
+        self._search_lc: str = ""  # lowered once per keystroke, not per card
         self._publishing_ids: set[str] = set()
 
         # Stored so cards can be rebuilt on catalogue reload.
         self._entries: list[AppEntry] = []
         self._resolve_asset: Callable[[str], str] | None = None
+        # rel path -> resolved local path for the current resolver, so a
+        # display-mode rebuild doesn't re-resolve (and re-stat) every asset.
+        self._resolved_assets: dict[str, str] = {}
         self._installed_ids: set[str] = set()
         # ── Content stack (grid / status page) ───────────────────────────
         self._stack = Gtk.Stack()
@@ -408,9 +508,27 @@ class BrowseView(Gtk.Box):
         grid_scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
         self._flow_box = make_app_grid(on_activated=self._on_card_activated)
+        # While a filter is active, visibility is decided by GTK calling
+        # _filter_func per child, which also records whether anything matched.
+        # With no filter the func is uninstalled so GTK skips the per-card
+        # call entirely (see _apply_filter).
+        self._any_visible = False
+        self._filtering = False
         grid_scroll.set_child(self._flow_box)
         self._stack.add_named(grid_scroll, "grid")
 
+        # Card artwork is decoded only for cards inside (or just around) the
+        # viewport and released once they scroll away.  Anything that can
+        # move cards relative to the viewport queues one recheck.
+        self._grid_scroll = grid_scroll
+        self._cards_in_view: list[AppCard | CapsuleCard] = []
+        self._view_update_pending = False
+        vadj = grid_scroll.get_vadjustment()
+        vadj.connect("value-changed", self._queue_view_update)
+        vadj.connect("changed", self._queue_view_update)
+        grid_scroll.connect("map", self._queue_view_update)
+        grid_scroll.connect("unmap", self._queue_view_update)
+
         # Status / empty-state page.
         self._status = Adw.StatusPage()
         self._status.set_icon_name("package-x-generic-symbolic")
@@ -446,7 +564,10 @@ class BrowseView(Gtk.Box):
         entry_repo_uris: dict[str, set[str]] | None = None,
     ) -> None:
         """Populate the grid from a list of catalogue entries."""
-        self._entries = entries
+        # Sorted once here so display-mode rebuilds don't re-sort.
+        self._entries = sorted(entries, key=lambda e: natural_sort_key(e.name))
+        if resolve_asset is not self._resolve_asset:
+            self._resolved_assets.clear()
         self._resolve_asset = resolve_asset
         self._installed_ids = installed_ids or set()
         self._entry_repo_uris: dict[str, set[str]] = entry_repo_uris or {}
@@ -470,8 +591,8 @@ class BrowseView(Gtk.Box):
         """Rebuild all cards from the stored entry/resolver state.
 
         Image assets are resolved on a background thread so the UI stays
-        responsive.  Once all assets are cached, the cards are created in
-        one batch on the main thread.
+        responsive.  Once all assets are cached, the cards are created on
+        the main thread in chunks of ``_BUILD_CHUNK`` per idle tick.
         """
         self._clear()
         self._rebuild_gen += 1
@@ -481,33 +602,50 @@ class BrowseView(Gtk.Box):
             self._show_status(self._empty_title, self._empty_description)
             return
 
+        if len(self._entries) > _FLAT_CARDS_THRESHOLD:
+            _ensure_flat_cards_css()
+            self._flow_box.add_css_class("flat-cards")
+        else:
+            self._flow_box.remove_css_class("flat-cards")
+
         card_cls = CapsuleCard if self._display_mode == "capsule" else AppCard
         resolve = self._resolve_asset
         installed_ids = self._installed_ids
         entry_repo_uris = self._entry_repo_uris
-        sorted_entries = sorted(self._entries, key=lambda e: natural_sort_key(e.name))
+        sorted_entries = self._entries
 
         def _resolve_worker() -> None:
             """Background thread: pre-resolve assets so they're cached."""
+            resolved_assets = self._resolved_assets
             resolved: list[tuple[AppEntry, str | None]] = []
             for entry in sorted_entries:
                 if self._rebuild_gen != gen:
                     return  # cancelled by a newer rebuild
                 asset_rel = entry.icon if card_cls is AppCard else entry.cover
-                path = None
-                if resolve and asset_rel:
+                path = resolved_assets.get(asset_rel) if asset_rel else None
+                if path is None and resolve and asset_rel:
                     try:
                         path = resolve(asset_rel)
                     except Exception:
                         pass  # card constructor handles missing images
+                    else:
+                        resolved_assets[asset_rel] = path
                 resolved.append((entry, path))
-            GLib.idle_add(_build_all, resolved)
+            GLib.idle_add(_build_chunk, iter(resolved))
+
+        def _build_chunk(pending: Iterator[tuple[AppEntry, str | None]]) -> bool:
+            """Build and append up to ``_BUILD_CHUNK`` cards per idle tick.
 
-        def _build_all(resolved: list[tuple[AppEntry, str | None]]) -> bool:
+            Yielding between chunks lets the first screenful paint before
+            the rest of a large catalogue has been turned into widgets.
+            """
             if self._rebuild_gen != gen:
                 return False  # stale
             publishing = self._publishing_ids
-            for entry, asset_path in resolved:
+            chunk = list(itertools.islice(pending, _BUILD_CHUNK))
+            # FlowBox runs _filter_func on each insert, so new cards pick up
+            # the active filter without a separate pass.
+            for entry, asset_path in chunk:
                 card = card_cls(
                     entry,
                     asset_path=asset_path,
@@ -518,8 +656,15 @@ class BrowseView(Gtk.Box):
                     card.set_publishing(True)
                 self._cards.append(card)
                 self._flow_box.append(card)
-            self._apply_filter()
-            return False
+            if chunk and not self._filtering:
+                self._any_visible = True
+            self._queue_view_update()
+            if len(chunk) < _BUILD_CHUNK:
+                self._sync_status()
+                return False
+            if self._any_visible:
+                self._stack.set_visible_child_name("grid")
+            return True
 
         thread = threading.Thread(target=_resolve_worker, daemon=True)
         thread.start()
@@ -542,23 +687,37 @@ class BrowseView(Gtk.Box):
         if not self._status.get_icon_name():
             self._status.set_icon_name("package-x-generic-symbolic")
 
+    # The setters below skip the filter pass when nothing changed — the
+    # window pushes every filter to all three browse views at once.
+
     def set_search_text(self, text: str) -> None:
+        if text == self._search_text:
+            return
         self._search_text = text
+        self._search_lc = text.lower()
         self._apply_filter()
 
     def set_active_categories(self, categories: set[str]) -> None:
+        if categories == self._active_categories:
+            return
         self._active_categories = categories
         self._apply_filter()
 
     def set_active_repos(self, repos: set[str]) -> None:
+        if repos == self._active_repos:
+            return
         self._active_repos = repos
         self._apply_filter()
 
     def set_active_genres(self, genres: set[str]) -> None:
+        if genres == self._active_genres:
+            return
         self._active_genres = genres
         self._apply_filter()
 
     def set_active_platforms(self, platforms: set[str]) -> None:
+        if platforms == self._active_platforms:
+            return
         self._active_platforms = platforms
         self._apply_filter()
 
@@ -573,19 +732,90 @@ class BrowseView(Gtk.Box):
 
     # ── Internals ─────────────────────────────────────────────────────────
 
-    def _apply_filter(self) -> None:
-        any_visible = False
-        for card in self._cards:
-            visible = card.matches(
-                self._active_categories, self._search_text,
-                self._active_repos, self._active_genres,
-                self._active_platforms,
-            )
-            card.set_visible(visible)
-            if visible:
-                any_visible = True
+    def _filter_func(self, card: AppCard | CapsuleCard) -> bool:
+        visible = card.matches(
+            self._active_categories, self._search_lc,
+            self._active_repos, self._active_genres,
+            self._active_platforms,
+        )
+        if visible:
+            self._any_visible = True
+        return visible
 
-        if not any_visible:
+    def _apply_filter(self) -> None:
+        filtering = bool(
+            self._search_lc or self._active_categories or self._active_repos
+            or self._active_genres or self._active_platforms
+        )
+        if filtering:
+            self._any_visible = False
+            if self._filtering:
+                self._flow_box.invalidate_filter()
+            else:
+                self._flow_box.set_filter_func(self._filter_func)
+        else:
+            if self._filtering:
+                self._flow_box.set_filter_func(None)
+            self._any_visible = bool(self._cards)
+        self._filtering = filtering
+        self._sync_status()
+        self._queue_view_update()
+
+    def _queue_view_update(self, *_args) -> None:
+        if self._view_update_pending:
+            return
+        self._view_update_pending = True
+        # Default-idle priority runs after GTK's layout pass, so the card
+        # positions checked below are current.
+        GLib.idle_add(self._update_cards_in_view, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _update_cards_in_view(self) -> bool:
+        """Tell cards whether they are near the viewport so they load or drop artwork."""
+        self._view_update_pending = False
+        in_view = self._find_cards_in_view() if self._grid_scroll.get_mapped() else []
+        current = set(in_view)
+        for card in self._cards_in_view:
+            if card not in current:
+                card.set_in_view(False)
+        for card in in_view:
+            card.set_in_view(True)
+        self._cards_in_view = in_view
+        return GLib.SOURCE_REMOVE
+
+    def _find_cards_in_view(self) -> list[AppCard | CapsuleCard]:
+        """Return the shown cards within half a page of the viewport, in order.
+
+        Shown cards are laid out in reading order, so their bottom edges
+        never decrease; the first one in range is found by bisection and
+        the scan stops at the first card below the range.
+        """
+        scroll = self._grid_scroll
+        height = scroll.get_height()
+        margin = height // 2  # load ahead so scrolling rarely shows fallbacks
+        top, bottom = -margin, height + margin
+        # FlowBox hides filtered-out children via child-visible.
+        shown = [c for c in self._cards if c.get_child_visible()]
+
+        lo, hi = 0, len(shown)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            ok, rect = shown[mid].compute_bounds(scroll)
+            if ok and rect.get_y() + rect.get_height() <= top:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        found = []
+        for card in itertools.islice(shown, lo, None):
+            ok, rect = card.compute_bounds(scroll)
+            if not ok or rect.get_y() >= bottom:
+                break
+            found.append(card)
+        return found
+
+    def _sync_status(self) -> None:
+        """Show the grid, or an empty-state page if no card matched."""
+        if not self._any_visible:
             if self._search_text:
                 self._show_status(
                     "No Results",
@@ -603,9 +833,10 @@ class BrowseView(Gtk.Box):
         self._stack.set_visible_child_name("status")
 
     def _clear(self) -> None:
-        while (child := self._flow_box.get_first_child()) is not None:
-            self._flow_box.remove(child)
+        self._flow_box.remove_all()
         self._cards.clear()
+        self._cards_in_view = []
+        self._any_visible = False
         self._active_categories = set()
         self._active_repos = set()
         self._active_platforms = set()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+import shutil
 import threading
 from pathlib import Path
 from typing import Callable
@@ -20,11 +21,24 @@ from cellar.utils.async_work import run_in_background
 from cellar.utils.paths import short_path as _short_path
 from cellar.utils.progress import fmt_stats as _fmt_dl_stats
 from cellar.utils.progress import user_facing_error
-from cellar.views.widgets import make_progress_page, set_margins
+from cellar.utils.textures import (
+    display_scale,
+    get_texture,
+    request_texture,
+)
+from cellar.views.widgets import FALLBACK_APP_GICON, make_progress_page, set_margins
 
 log = logging.getLogger(__name__)
 
 _ICON_SIZE = 96
+_SCREENSHOT_HEIGHT = 300
+
+# Plain value cards in the info row: (AppEntry attribute, icon, caption).
+# Shown in this order, each only when the attribute is set.
+_SIMPLE_INFO_CARDS = (
+    ("version", "software-update-available-symbolic", "Version"),
+    ("release_year", "x-office-calendar-symbolic", "Released"),
+)
 
 
 def _apply_logo_shadow(widget: Gtk.Widget) -> None:
@@ -153,6 +167,7 @@ class DetailView(Gtk.Box):
             and bool(_cat_crc and _stored_crc and _cat_crc != _stored_crc)
         )
         self._screenshot_paths: list[str] = []
+        self._remove_dialog: RemoveDialog | None = None  # reused across cancel/retry
         self._resolved_runner: str = ""
         self._runner_label: Gtk.Label | None = None
         self._base_warning_icon: Gtk.Image | None = None
@@ -268,8 +283,12 @@ class DetailView(Gtk.Box):
             content_box.append(self._make_description())
 
         self._content_box = content_box
-        self._info_cards = self._make_info_cards()
+        # The info cards sit below the fold; build them on the next idle so
+        # the header, screenshots and description paint first.  The empty
+        # box holds the slot that _rebuild_info_cards swaps in place.
+        self._info_cards = Gtk.Box()
         content_box.append(self._info_cards)
+        GLib.idle_add(self._build_deferred_sections)
 
         # Bottom spacer absorbs extra vertical space so the content stays
         # at its natural size when the page is shorter than the viewport
@@ -278,6 +297,10 @@ class DetailView(Gtk.Box):
         spacer.set_vexpand(True)
         self._outer.append(spacer)
 
+    def _build_deferred_sections(self) -> bool:
+        self._rebuild_info_cards()
+        return False
+
     # ------------------------------------------------------------------
     # Edit catalogue entry
     # ------------------------------------------------------------------
@@ -432,38 +455,35 @@ class DetailView(Gtk.Box):
 
     def _update_install_button(self) -> None:
         btn = self._install_btn
-        for cls in ("suggested-action", "success", "destructive-action"):
-            btn.remove_css_class(cls)
-        # Hide spinner button by default.
-        self._spinner_btn.set_visible(False)
+        show_update = False
+        pending = not self._is_installed and self._is_install_pending()
         if self._is_installed:
-            self._install_btn_label.set_label("Open")
-            btn.add_css_class("suggested-action")
-            btn.set_sensitive(True)
-            btn.set_tooltip_text("")
-            self._update_indicator.set_visible(self._has_update and not self._is_offline)
-            self._update_indicator.set_tooltip_text(
-                "Update available — see Options menu"
-                if (self._has_update and not self._is_offline) else ""
-            )
-        elif self._is_install_pending():
-            self._install_btn_label.set_label("Cancel")
-            btn.add_css_class("destructive-action")
-            btn.set_sensitive(True)
-            btn.set_tooltip_text("")
-            self._update_indicator.set_visible(False)
-            self._spinner_btn.set_visible(True)
+            label, css, sensitive, tooltip = "Open", "suggested-action", True, ""
+            show_update = self._has_update and not self._is_offline
+        elif pending:
+            label, css, sensitive, tooltip = "Cancel", "destructive-action", True, ""
         elif self._is_offline:
-            self._install_btn_label.set_label("Unavailable")
-            btn.set_sensitive(False)
-            btn.set_tooltip_text("Repository is offline")
-            self._update_indicator.set_visible(False)
+            label, css, sensitive, tooltip = (
+                "Unavailable", None, False, "Repository is offline",
+            )
         else:
-            self._install_btn_label.set_label("Install")
-            btn.add_css_class("suggested-action")
-            btn.set_sensitive(True)
-            btn.set_tooltip_text("")
-            self._update_indicator.set_visible(False)
+            label, css, sensitive, tooltip = "Install", "suggested-action", True, ""
+
+        # Only touch the style classes that actually change — each add or
+        # remove restyles the button.
+        for cls in ("suggested-action", "success", "destructive-action"):
+            if cls != css and btn.has_css_class(cls):
+                btn.remove_css_class(cls)
+        if css and not btn.has_css_class(css):
+            btn.add_css_class(css)
+        self._install_btn_label.set_label(label)
+        btn.set_sensitive(sensitive)
+        btn.set_tooltip_text(tooltip)
+        self._update_indicator.set_visible(show_update)
+        self._update_indicator.set_tooltip_text(
+            "Update available — see Options menu" if show_update else ""
+        )
+        self._spinner_btn.set_visible(pending)
         self._gear_btn.set_visible(self._is_installed)
         if self._is_installed:
             self._refresh_gear_menu()
@@ -907,12 +927,15 @@ class DetailView(Gtk.Box):
     def _on_remove_clicked(self) -> None:
         folder = self._get_install_folder()
         prefix_path = Path(folder) if folder else None
-        dialog = RemoveDialog(
-            entry=self._entry,
-            prefix_path=prefix_path,
-            on_confirm=self._on_remove_confirmed,
-        )
-        dialog.present(self.get_root())
+        if self._remove_dialog is None:
+            self._remove_dialog = RemoveDialog(
+                entry=self._entry,
+                prefix_path=prefix_path,
+                on_confirm=self._on_remove_confirmed,
+            )
+        else:
+            self._remove_dialog.set_prefix_path(prefix_path)
+        self._remove_dialog.present(self.get_root())
 
     def _on_update_clicked(self, _btn) -> None:
         from cellar.backend import database  # noqa: PLC0415
@@ -966,10 +989,9 @@ class DetailView(Gtk.Box):
             self._on_update_done(install_size, delta_size)
 
     def _on_remove_confirmed(self) -> None:
-        import shutil
-
         from cellar.backend import database
 
+        self._remove_dialog = None
         folder = self._get_install_folder()
         if folder and Path(folder).is_dir():
             try:
@@ -1168,8 +1190,6 @@ class DetailView(Gtk.Box):
         )
 
     def _on_change_location_response(self, dialog, result) -> None:
-        import shutil
-
         from cellar.backend import database
         from cellar.utils.paths import sanitize_dirname
 
@@ -1631,11 +1651,9 @@ class DetailView(Gtk.Box):
             margin_bottom=18,
         )
 
-        dev_parts: list[str] = []
-        if e.developer:
-            dev_parts.append(e.developer)
-        if e.publisher and e.publisher != e.developer:
-            dev_parts.append(e.publisher)
+        dev_parts = [
+            p for p in (e.developer, e.publisher if e.publisher != e.developer else None) if p
+        ]
 
         # Logo column: logo image, with developer credit below when title is hidden.
         # Falls back to a square icon when no logo is set.
@@ -1747,20 +1765,22 @@ class DetailView(Gtk.Box):
 
         # Fast path: peek the cache for every screenshot.  If all are already
         # on disk, build the carousel synchronously — no placeholders, no shift.
-        cached_paths = []
-        for s in screenshots:
-            p = self._peek(s)
-            exists = bool(p) and os.path.isfile(p)
-            log.debug("  peek %r -> %r  isfile=%s", s, p, exists)
-            if exists:
-                cached_paths.append(p)
-            else:
-                cached_paths = []
-                break
+        cached_paths = [self._peek(s) for s in screenshots]
+        if not all(cached_paths) or not _existing_files(cached_paths).issuperset(cached_paths):
+            log.debug("  peek: not all cached: %s", cached_paths)
+            cached_paths = []
 
         wrapper = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         wrapper.add_css_class("screenshots-band")
 
+        # Only the current carousel page and its neighbours hold a decoded
+        # texture.  Every page registers its (path, picture) here by index;
+        # _screenshot_loaded tracks which ones currently show their image.
+        self._screenshot_carousel: Adw.Carousel | None = None
+        self._screenshot_pages: dict[int, tuple[str, Gtk.Picture]] = {}
+        self._screenshot_loaded: set[int] = set()
+        self._screenshot_check_pending = False
+
         if cached_paths:
             log.debug("_make_screenshots: fast path — all %d cached", len(cached_paths))
             self._screenshot_paths = cached_paths
@@ -1775,7 +1795,7 @@ class DetailView(Gtk.Box):
         slots: list[Gtk.Box] = []
         for _ in screenshots:
             slot = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            slot.set_size_request(-1, 300)
+            slot.set_size_request(-1, _SCREENSHOT_HEIGHT)
             slot.set_margin_start(8)
             slot.set_margin_end(8)
             slot.set_margin_top(4)
@@ -1811,11 +1831,13 @@ class DetailView(Gtk.Box):
                     slot.remove(child)
                     child = nxt
                 # Insert real picture (margins are already on the slot)
-                pic = Gtk.Picture.new_for_filename(path)
-                pic.set_content_fit(Gtk.ContentFit.CONTAIN)
-                pic.set_can_shrink(True)
-                pic.set_overflow(Gtk.Overflow.HIDDEN)
-                pic.add_css_class("screenshot-pic")
+                pic = Gtk.Picture(
+                    content_fit=Gtk.ContentFit.CONTAIN,
+                    can_shrink=True,
+                    overflow=Gtk.Overflow.HIDDEN,
+                    css_classes=["screenshot-pic"],
+                )
+                self._load_screenshot_texture(idx, path, pic)
                 click = Gtk.GestureClick()
                 click.connect("released", self._on_screenshot_clicked, idx)
                 pic.add_controller(click)
@@ -1828,28 +1850,86 @@ class DetailView(Gtk.Box):
         return wrapper
 
     def _make_screenshot_pic(self, path: str, idx: int) -> Gtk.Picture:
-        """Build a single carousel page widget for a screenshot at *path*."""
-        pic = Gtk.Picture.new_for_filename(path)
-        pic.set_content_fit(Gtk.ContentFit.CONTAIN)
-        pic.set_can_shrink(True)
-        pic.set_size_request(-1, 300)
-        pic.set_cursor(Gdk.Cursor.new_from_name("pointer"))
-        pic.set_overflow(Gtk.Overflow.HIDDEN)
-        pic.set_margin_start(8)
-        pic.set_margin_end(8)
-        pic.set_margin_top(4)
-        pic.set_margin_bottom(10)
-        pic.add_css_class("screenshot-pic")
+        """Build a single carousel page widget for a screenshot at *path*.
+
+        The picture is returned empty and filled in once the texture has
+        been decoded on a background thread.
+        """
+        pic = Gtk.Picture(
+            content_fit=Gtk.ContentFit.CONTAIN,
+            can_shrink=True,
+            height_request=_SCREENSHOT_HEIGHT,
+            cursor=Gdk.Cursor.new_from_name("pointer"),
+            overflow=Gtk.Overflow.HIDDEN,
+            margin_start=8,
+            margin_end=8,
+            margin_top=4,
+            margin_bottom=10,
+            css_classes=["screenshot-pic"],
+        )
+        self._load_screenshot_texture(idx, path, pic)
         click = Gtk.GestureClick()
         click.connect("released", self._on_screenshot_clicked, idx)
         pic.add_controller(click)
         return pic
 
+    def _load_screenshot_texture(self, idx: int, path: str, pic: Gtk.Picture) -> None:
+        """Register page *idx* and fill it now if it is near the current page.
+
+        Other pages are filled (and emptied again) by
+        :meth:`_sync_near_screenshots` as the carousel moves.
+        """
+        self._screenshot_pages[idx] = (path, pic)
+        carousel = self._screenshot_carousel
+        current = round(carousel.get_position()) if carousel is not None else 0
+        if abs(idx - current) <= 1:
+            self._show_screenshot(idx)
+
+    def _show_screenshot(self, idx: int) -> None:
+        path, pic = self._screenshot_pages[idx]
+        self._screenshot_loaded.add(idx)
+
+        def _set(texture: Gdk.Texture) -> None:
+            if idx in self._screenshot_loaded:  # not released while decoding
+                pic.set_paintable(texture)
+
+        request_texture(path, 0, _SCREENSHOT_HEIGHT * display_scale(), _set, weak=True)
+
+    def _on_screenshot_position(self, carousel: Adw.Carousel, _pspec) -> None:
+        # notify::position fires every frame of a swipe; check once per
+        # main-loop pass, against the position it settled on.
+        if self._screenshot_check_pending or not self._screenshot_pages:
+            return
+        self._screenshot_check_pending = True
+        GLib.idle_add(
+            self._sync_near_screenshots, carousel, priority=GLib.PRIORITY_DEFAULT_IDLE,
+        )
+
+    def _sync_near_screenshots(self, carousel: Adw.Carousel) -> bool:
+        """Show the current page and its neighbours; release every other page.
+
+        Screenshots are cached weakly, so a released page's texture is
+        freed unless another view still shows it; swiping back decodes it
+        again.
+        """
+        self._screenshot_check_pending = False
+        current = round(carousel.get_position())
+        near = {current - 1, current, current + 1}
+        for idx in self._screenshot_loaded - near:
+            self._screenshot_pages[idx][1].set_paintable(None)
+        self._screenshot_loaded &= near
+        for idx in near - self._screenshot_loaded:
+            if idx in self._screenshot_pages:
+                self._show_screenshot(idx)
+        return GLib.SOURCE_REMOVE
+
     def _populate_screenshots(self, wrapper: Gtk.Box, pages: list[Gtk.Widget]) -> None:
         """Build and append carousel content into *wrapper* from pre-built page widgets."""
         carousel = Adw.Carousel(
             allow_scroll_wheel=False, reveal_duration=200, spacing=12,
         )
+        self._screenshot_carousel = carousel
+        carousel.connect("notify::position", self._on_screenshot_position)
         multiple = len(pages) > 1
 
         for page in pages:
@@ -1984,16 +2064,16 @@ class DetailView(Gtk.Box):
             return card, val_lbl
 
         if self._is_installed:
-            stored_size = (self._installed_record or {}).get("install_size") or 0
-            delta_size = (self._installed_record or {}).get("delta_size") or 0
+            rec = self._installed_record or {}
+            stored_size = rec.get("install_size") or 0
+            delta_size = rec.get("delta_size") or 0
             if stored_size:
                 display_size = stored_size
                 # On CoW filesystems, delta apps share base files via reflinks —
                 # show the delta-only size which reflects actual unique disk usage.
                 if delta_size:
                     from cellar.utils.paths import is_cow_filesystem as _is_cow
-                    _rec = self._installed_record or {}
-                    _install_path = _rec.get("install_path", "")
+                    _install_path = rec.get("install_path", "")
                     if not _install_path:
                         from cellar.backend.umu import prefixes_dir as _prefixes_dir
                         _install_path = str(_prefixes_dir())
@@ -2028,11 +2108,10 @@ class DetailView(Gtk.Box):
             _add(self._make_wine_card())
             self._resolve_base_async()
 
-        if e.version:
-            _add(_simple_card("software-update-available-symbolic", e.version, "Version")[0])
-
-        if e.release_year:
-            _add(_simple_card("x-office-calendar-symbolic", str(e.release_year), "Released")[0])
+        for attr, icon_name, label in _SIMPLE_INFO_CARDS:
+            value = getattr(e, attr)
+            if value:
+                _add(_simple_card(icon_name, str(value), label)[0])
 
         if e.category:
             cat_card = _simple_card(e.category_icon or "tag-symbolic", e.category, "Category")[0]
@@ -2376,27 +2455,34 @@ class DetailView(Gtk.Box):
     # ------------------------------------------------------------------
 
     def _make_icon(self, rel_path: str, size: int, *, cover_fallback: str = "") -> Gtk.Widget:
-        def _build_widget(path: str, is_cover: bool) -> Gtk.Widget:
+        px = size * display_scale()
+
+        def _build_widget(texture: Gdk.Texture | None, is_cover: bool) -> Gtk.Widget:
             if is_cover:
-                pic = Gtk.Picture.new_for_filename(path)
+                pic = Gtk.Picture.new_for_paintable(texture)
                 pic.set_size_request(size, size)
                 pic.set_content_fit(Gtk.ContentFit.COVER)
                 pic.add_css_class("icon-dropshadow")
                 return pic
-            img = Gtk.Image.new_from_file(path)
+            img = Gtk.Image.new_from_paintable(texture)
             img.set_pixel_size(size)
             return img
 
-        # Fast path: if the image is already on disk, load natively.
+        # Fast path: if the image is already on disk, load natively.  Icons
+        # are small, so decoding inline avoids a placeholder flash.  A file
+        # that fails to decode falls through to the next candidate and, if
+        # none works, to the fallback icon below.
         for path_arg, is_cover in ((rel_path, False), (cover_fallback, True)):
             if not path_arg:
                 continue
             cached = self._peek(path_arg)
             if cached and os.path.isfile(cached):
-                return _build_widget(cached, is_cover)
+                texture = get_texture(cached, px, px, cover=is_cover)
+                if texture is not None:
+                    return _build_widget(texture, is_cover)
 
         # Slow path: needs a network fetch — use a placeholder stack and swap async.
-        placeholder = Gtk.Image.new_from_icon_name("application-x-executable")
+        placeholder = Gtk.Image.new_from_gicon(FALLBACK_APP_GICON)
         placeholder.set_pixel_size(size)
 
         stack = Gtk.Stack()
@@ -2420,9 +2506,12 @@ class DetailView(Gtk.Box):
             if result is None:
                 return
             path, is_cover = result
-            real = _build_widget(path, is_cover)
-            stack.add_named(real, "real")
-            stack.set_visible_child_name("real")
+
+            def _show(texture: Gdk.Texture) -> None:
+                stack.add_named(_build_widget(texture, is_cover), "real")
+                stack.set_visible_child_name("real")
+
+            request_texture(path, px, px, _show, cover=is_cover)
 
         run_in_background(_work, on_done=_on_loaded)
         return stack
@@ -2513,6 +2602,13 @@ class InstallProgressDialog(Adw.Dialog):
         self._runner_entry = runner_entry
         self._runner_archive_uri = runner_archive_uri
 
+        # Latest progress-bar values posted by the install thread, applied
+        # by one _flush_progress per frame however often the callbacks fire.
+        self._progress_lock = threading.Lock()
+        self._pending_fraction: float | None = None
+        self._pending_text: str | None = None
+        self._flush_scheduled = False
+
         self._build_ui()
         self.connect("closed", self._on_closed)
 
@@ -2565,13 +2661,13 @@ class InstallProgressDialog(Adw.Dialog):
             GLib.idle_add(self._on_phase_change, label)
 
         def _dl_progress(fraction: float) -> None:
-            GLib.idle_add(self._progress_bar.set_fraction, fraction)
+            self._post_progress(fraction=fraction)
 
         def _dl_stats(downloaded: int, total: int, speed: float) -> None:
-            GLib.idle_add(self._progress_bar.set_text, _fmt_dl_stats(downloaded, total, speed))
+            self._post_progress(text=_fmt_dl_stats(downloaded, total, speed))
 
         def _inst_progress(fraction: float) -> None:
-            GLib.idle_add(self._progress_bar.set_fraction, fraction)
+            self._post_progress(fraction=fraction)
 
         def _run() -> None:
             try:
@@ -2617,13 +2713,13 @@ class InstallProgressDialog(Adw.Dialog):
             GLib.idle_add(self._on_phase_change, label)
 
         def _dl_progress(fraction: float) -> None:
-            GLib.idle_add(self._progress_bar.set_fraction, fraction)
+            self._post_progress(fraction=fraction)
 
         def _dl_stats(downloaded: int, total: int, speed: float) -> None:
-            GLib.idle_add(self._progress_bar.set_text, _fmt_dl_stats(downloaded, total, speed))
+            self._post_progress(text=_fmt_dl_stats(downloaded, total, speed))
 
         def _inst_progress(fraction: float) -> None:
-            GLib.idle_add(self._progress_bar.set_fraction, fraction)
+            self._post_progress(fraction=fraction)
 
         def _run() -> None:
             try:
@@ -2654,8 +2750,41 @@ class InstallProgressDialog(Adw.Dialog):
 
         threading.Thread(target=_run, daemon=True).start()
 
+    def _post_progress(
+        self, *, fraction: float | None = None, text: str | None = None,
+    ) -> None:
+        """Record a progress update from the install thread.
+
+        Schedules a flush only if none is pending, so the main loop sees at
+        most one progress wakeup per frame.
+        """
+        with self._progress_lock:
+            if fraction is not None:
+                self._pending_fraction = fraction
+            if text is not None:
+                self._pending_text = text
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        GLib.timeout_add(16, self._flush_progress)
+
+    def _flush_progress(self) -> bool:
+        with self._progress_lock:
+            fraction, self._pending_fraction = self._pending_fraction, None
+            text, self._pending_text = self._pending_text, None
+            self._flush_scheduled = False
+        if fraction is not None:
+            self._progress_bar.set_fraction(fraction)
+        if text is not None:
+            self._progress_bar.set_text(text)
+        return GLib.SOURCE_REMOVE
+
     def _on_phase_change(self, label: str) -> None:
         """Reset bar and update label on phase transition (runs on UI thread)."""
+        # Drop values from the previous phase still waiting for a flush.
+        with self._progress_lock:
+            self._pending_fraction = None
+            self._pending_text = None
         # Stop any active pulse
         if self._pulse_id is not None:
             GLib.source_remove(self._pulse_id)
@@ -2720,15 +2849,8 @@ class RemoveDialog(Adw.AlertDialog):
         prefix_path,          # pathlib.Path | None
         on_confirm: Callable,
     ) -> None:
-        path_str = _short_path(prefix_path) if prefix_path else "unknown location"
-        super().__init__(
-            heading=f"Remove {entry.name}?",
-            body=(
-                f"The directory at {path_str} will be permanently deleted. "
-                "Any data stored inside the prefix — saved games, configuration "
-                "files, and registry changes — will be lost."
-            ),
-        )
+        super().__init__(heading=f"Remove {entry.name}?")
+        self.set_prefix_path(prefix_path)
         self._on_confirm = on_confirm
         self.add_response("cancel", "Cancel")
         self.add_response("remove", "Remove")
@@ -2737,6 +2859,15 @@ class RemoveDialog(Adw.AlertDialog):
         self.set_close_response("cancel")
         self.connect("response", self._on_response)
 
+    def set_prefix_path(self, prefix_path) -> None:
+        """Point the warning text at *prefix_path* (a ``Path`` or ``None``)."""
+        path_str = _short_path(prefix_path) if prefix_path else "unknown location"
+        self.set_body(
+            f"The directory at {path_str} will be permanently deleted. "
+            "Any data stored inside the prefix — saved games, configuration "
+            "files, and registry changes — will be lost."
+        )
+
     def _on_response(self, _dialog, response: str) -> None:
         if response == "remove":
             self._on_confirm()
@@ -2834,6 +2965,23 @@ class ScreenshotDialog(Adw.Dialog):
 # Widget factories
 # ---------------------------------------------------------------------------
 
+def _existing_files(paths: list[str]) -> set[str]:
+    """Return the members of *paths* that are regular files.
+
+    Lists each parent directory once instead of stat-ing every path.
+    """
+    names: dict[str, set[str]] = {}
+    for parent in {os.path.dirname(p) for p in paths}:
+        try:
+            with os.scandir(parent or ".") as it:
+                names[parent] = {d.name for d in it if d.is_file()}
+        except OSError:
+            names[parent] = set()
+    return {
+        p for p in paths if os.path.basename(p) in names[os.path.dirname(p)]
+    }
+
+
 def _parse_launch_env(env_str: str) -> dict[str, str]:
     """Parse a launch-environment string into a ``{KEY: value}`` dict.
 
@@ -2870,9 +3018,12 @@ def _base_status_subtitle(installed: bool) -> str:
     return "Already present on your system" if installed else "Will also be downloaded"
 
 
+_BYTE_UNITS = ("B", "kB", "MB", "GB", "TB", "PB")
+
+
 def _fmt_bytes(n: int) -> str:
-    for unit in ("B", "kB", "MB", "GB", "TB"):
-        if n < 1000:
-            return f"{n:.1f} {unit}" if unit != "B" else f"{n} B"
-        n /= 1000
-    return f"{n:.1f} PB"
+    if n < 1000:
+        return f"{n} B"
+    # Decimal units: the digit count picks the unit without a divide loop.
+    i = min((len(str(int(n))) - 1) // 3, len(_BYTE_UNITS) - 1)
+    return f"{n / 1000 ** i:.1f} {_BYTE_UNITS[i]}"
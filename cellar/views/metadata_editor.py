@@ -10,6 +10,7 @@ Can be opened from any entry point in the app:
 from __future__ import annotations
 
 import logging
+import os
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -34,6 +35,15 @@ _STRATEGIES = ["safe", "full"]
 _STRATEGY_LABELS = ["Safe (preserve user data)", "Full (complete replacement)"]
 
 
+def _parse_release_year(text: str) -> int | None:
+    """Return *text* as a release year, or ``None`` if blank or implausible."""
+    try:
+        year = int(text)
+    except ValueError:
+        return None
+    return year if 1900 <= year <= 2100 else None
+
+
 # ── Save contexts ─────────────────────────────────────────────────────────────
 
 class _SaveContext(ABC):
@@ -211,11 +221,7 @@ class ProjectContext(_SaveContext):
         p.category = fields.get("category", "")
         p.developer = fields.get("developer", "")
         p.publisher = fields.get("publisher", "")
-        year_txt = fields.get("release_year", "")
-        try:
-            p.release_year = int(year_txt) if year_txt else None
-        except ValueError:
-            p.release_year = None
+        p.release_year = _parse_release_year(fields.get("release_year", ""))
         steam_txt = fields.get("steam_appid", "")
         p.steam_appid = int(steam_txt) if steam_txt.isdigit() else None
         p.website = fields.get("website", "")
@@ -371,7 +377,6 @@ class RepoContext(_SaveContext):
         }
 
     def populate_media(self, media: "MediaPanel") -> None:
-        import os as _os
         e = self._entry
 
         # Set subtitles immediately (no I/O)
@@ -381,7 +386,7 @@ class RepoContext(_SaveContext):
 
         def _peek_or_none(rel: str) -> str | None:
             p = peek(rel) if rel else None
-            return p if (p and _os.path.isfile(p)) else None
+            return p if (p and os.path.isfile(p)) else None
 
         # Synchronous cache peek for single images
         for key, rel in [("icon", e.icon), ("cover", e.cover), ("logo", e.logo)]:
@@ -460,8 +465,7 @@ class RepoContext(_SaveContext):
         description = fields.get("description", "")
         developer = fields.get("developer", "")
         publisher = fields.get("publisher", "")
-        year_text = fields.get("release_year", "")
-        release_year = int(year_text) if year_text.isdigit() else None
+        release_year = _parse_release_year(fields.get("release_year", ""))
         steam_appid_text = fields.get("steam_appid", "")
         steam_appid = int(steam_appid_text) if steam_appid_text.isdigit() else None
         website = fields.get("website", "")
@@ -488,8 +492,8 @@ class RepoContext(_SaveContext):
         elif icon_path == "":
             icon_rel = ""
         else:
-            sfx = Path(icon_path).suffix.lower()
-            ext = ".png" if sfx in (".ico", ".bmp") else Path(icon_path).suffix
+            sfx = os.path.splitext(icon_path)[1]
+            ext = ".png" if sfx.lower() in (".ico", ".bmp") else sfx
             icon_rel = f"apps/{app_id}/icon{ext}"
 
         if cover_path is None:
@@ -497,7 +501,7 @@ class RepoContext(_SaveContext):
         elif cover_path == "":
             cover_rel = ""
         else:
-            cover_rel = f"apps/{app_id}/cover{Path(cover_path).suffix}"
+            cover_rel = f"apps/{app_id}/cover{os.path.splitext(cover_path)[1]}"
 
         if logo_path is None:
             logo_rel = e.logo
@@ -570,8 +574,9 @@ class RepoContext(_SaveContext):
                     except Exception as exc:
                         log.warning("Screenshot download failed: %s", exc)
             repo_images["screenshots"] = final_paths
+            ss_prefix = f"apps/{app_id}/screenshots/ss_placeholder_"
             ss_rels = tuple(
-                f"apps/{app_id}/screenshots/ss_placeholder_{i:03d}{Path(p).suffix}"
+                f"{ss_prefix}{i:03d}{os.path.splitext(p)[1]}"
                 for i, p in enumerate(final_paths)
             )
             ss_sources = {
@@ -647,6 +652,7 @@ class MetadataEditorDialog(Adw.Dialog):
         self._on_done = on_done
         self._cancel_event = threading.Event()
         self._screenshots_dirty = False
+        self._title_check_pending = False
         self._locally_installed = self._check_locally_installed()
         self._saved_result = None
         self._auto_lookup_query = auto_steam_query
@@ -711,13 +717,9 @@ class MetadataEditorDialog(Adw.Dialog):
             action_sensitive=action_sensitive,
         )
 
-        # Stack
-        self._stack = Gtk.Stack()
-        self._stack.add_named(self._build_form(fields, categories), "form")
-        self._stack.add_named(self._build_spinner(), "spinner")
-        self._stack.set_visible_child_name("form")
-
-        toolbar.set_content(self._stack)
+        # Save progress is shown in a ProgressDialog, so the form is the
+        # only page.
+        toolbar.set_content(self._build_form(fields, categories))
         self.set_child(toolbar)
 
         # Pre-fill launch targets and update strategy (RepoContext only)
@@ -750,6 +752,10 @@ class MetadataEditorDialog(Adw.Dialog):
         # Populate media panel
         ctx.populate_media(self._media)
 
+        # Baseline for detecting a Save with nothing changed.
+        self._initial_fields = fields
+        self._initial_hide_title = self._media.get_hide_title()
+
     def _build_form(self, fields: dict, categories: list[str]) -> Gtk.Widget:
         ctx = self._context
 
@@ -906,7 +912,12 @@ class MetadataEditorDialog(Adw.Dialog):
         self._desc_view.set_margin_start(12)
         self._desc_view.set_margin_end(12)
         self._desc_view.set_size_request(-1, 100)
-        self._desc_view.get_buffer().set_text(fields.get("description", ""))
+        self._desc_buffer = self._desc_view.get_buffer()
+        self._desc_initial = fields.get("description", "")
+        self._desc_buffer.set_text(self._desc_initial)
+        # Connected after the prefill so only user edits mark it dirty.
+        self._desc_dirty = False
+        self._desc_buffer.connect("changed", self._on_desc_changed)
         desc_outer.append(self._desc_view)
 
         desc_group.add(desc_outer)
@@ -918,10 +929,7 @@ class MetadataEditorDialog(Adw.Dialog):
             launch_group = Adw.PreferencesGroup(title="Launch Settings")
 
             self._strategy_row = Adw.ComboRow(title="Update Strategy")
-            strat_model = Gtk.StringList()
-            for lbl in _STRATEGY_LABELS:
-                strat_model.append(lbl)
-            self._strategy_row.set_model(strat_model)
+            self._strategy_row.set_model(Gtk.StringList.new(_STRATEGY_LABELS))
             launch_group.add(self._strategy_row)
 
             self._dxvk_row = None
@@ -970,10 +978,7 @@ class MetadataEditorDialog(Adw.Dialog):
                     title="Audio Driver",
                     subtitle="Wine audio backend override",
                 )
-                audio_model = Gtk.StringList()
-                for lbl in self._AUDIO_LABELS:
-                    audio_model.append(lbl)
-                self._audio_driver_row.set_model(audio_model)
+                self._audio_driver_row.set_model(Gtk.StringList.new(self._AUDIO_LABELS))
                 launch_group.add(self._audio_driver_row)
 
             add_target_row = Adw.ActionRow(title="Add Launch Target\u2026")
@@ -997,37 +1002,17 @@ class MetadataEditorDialog(Adw.Dialog):
 
         return scroll
 
-    def _build_spinner(self) -> Gtk.Widget:
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=18)
-        box.set_valign(Gtk.Align.CENTER)
-        box.set_margin_top(48)
-        box.set_margin_bottom(48)
-        box.set_margin_start(24)
-        box.set_margin_end(24)
-
-        spinner = Adw.Spinner()
-        spinner.set_halign(Gtk.Align.CENTER)
-
-        self._spinner_label = Gtk.Label(label="Saving\u2026")
-        self._spinner_label.add_css_class("dim-label")
-
-        self._cancel_spinner_btn = Gtk.Button(label="Cancel")
-        self._cancel_spinner_btn.set_halign(Gtk.Align.CENTER)
-        self._cancel_spinner_btn.connect("clicked", self._on_cancel_progress_clicked)
-
-        box.append(spinner)
-        box.append(self._spinner_label)
-        box.append(self._cancel_spinner_btn)
-        return box
-
     # ── Field collection ──────────────────────────────────────────────────
 
     def _collect_fields(self) -> dict:
         ctx = self._context
         cat_idx = self._cat_row.get_selected()
 
-        buf = self._desc_view.get_buffer()
-        description = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False).strip()
+        if self._desc_dirty:
+            buf = self._desc_buffer
+            description = buf.get_text(buf.get_start_iter(), buf.get_end_iter(), False).strip()
+        else:
+            description = self._desc_initial.strip()
 
         if isinstance(self._title_widget, Adw.EntryRow):
             name = self._title_widget.get_text().strip()
@@ -1094,6 +1079,10 @@ class MetadataEditorDialog(Adw.Dialog):
         images = self._collect_images()
 
         if ctx.save_is_async:
+            if not ctx.is_create and self._is_unchanged(fields, images):
+                # Nothing to write — skip the repo rewrite entirely.
+                self.close()
+                return
             self._do_async_save(fields, images)
         else:
             is_create = ctx.is_create  # capture before save() mutates ctx state
@@ -1105,6 +1094,17 @@ class MetadataEditorDialog(Adw.Dialog):
             elif self._on_changed:
                 self._on_changed()
 
+    def _is_unchanged(self, fields: dict, images: dict) -> bool:
+        """Return True if saving *fields* / *images* would not change anything."""
+        if self._screenshots_dirty:
+            return False
+        if any(images.get(k) is not None for k in ("icon", "cover", "logo")):
+            return False
+        if images.get("hide_title") != self._initial_hide_title:
+            return False
+        initial = self._initial_fields
+        return all(initial.get(k) == v for k, v in fields.items())
+
     def _do_async_save(self, fields: dict, images: dict) -> None:
         self._cancel_event.clear()
         progress = ProgressDialog(
@@ -1116,9 +1116,13 @@ class MetadataEditorDialog(Adw.Dialog):
         ctx = self._context
         _last_stats_t = [0.0]
 
+        def _apply_phase(label: str) -> bool:
+            progress.set_label(label)
+            progress.set_stats("")
+            return False
+
         def _phase(label: str) -> None:
-            GLib.idle_add(progress.set_label, label)
-            GLib.idle_add(progress.set_stats, "")
+            GLib.idle_add(_apply_phase, label)
 
         def _stats(copied: int, total: int, speed: float) -> None:
             now = time.monotonic()
@@ -1126,7 +1130,20 @@ class MetadataEditorDialog(Adw.Dialog):
                 _last_stats_t[0] = now
                 GLib.idle_add(progress.set_stats, _fmt_stats(copied, total, speed))
 
+        _last_progress = [0.0, 0.0]  # [fraction, monotonic time] of last post
+
         def _progress(fraction: float) -> None:
+            # Packager callbacks can fire per file; post at most ~30/s or
+            # per 1% step, and always post completion.
+            now = time.monotonic()
+            if (
+                fraction < 1.0
+                and fraction - _last_progress[0] < 0.01
+                and now - _last_progress[1] < 0.033
+            ):
+                return
+            _last_progress[0] = fraction
+            _last_progress[1] = now
             GLib.idle_add(progress.set_fraction, fraction)
 
         def _run():
@@ -1164,9 +1181,6 @@ class MetadataEditorDialog(Adw.Dialog):
         alert.set_close_response("close")
         alert.present(self)
 
-    def _on_cancel_progress_clicked(self, _btn) -> None:
-        self._cancel_event.set()
-
     # ── Cancel ────────────────────────────────────────────────────────────
 
     def _on_cancel_clicked(self, _btn) -> None:
@@ -1175,15 +1189,27 @@ class MetadataEditorDialog(Adw.Dialog):
 
     # ── Signal handlers ───────────────────────────────────────────────────
 
-    def _on_title_changed(self, row) -> None:
+    def _on_title_changed(self, _row) -> None:
+        # Typing fires this per keystroke; validate once per main-loop pass.
+        if self._title_check_pending:
+            return
+        self._title_check_pending = True
+        GLib.idle_add(self._check_title)
+
+    def _check_title(self) -> bool:
+        self._title_check_pending = False
         ctx = self._context
-        title = row.get_text().strip()
+        title = self._title_widget.get_text().strip()
         if ctx.is_create:
             from cellar.backend.packager import slugify
             self._slug_row.set_subtitle(slugify(title) if title else "")
             self._action_btn.set_sensitive(bool(title))
         elif ctx.save_is_async:
             self._action_btn.set_sensitive(bool(title))
+        return False
+
+    def _on_desc_changed(self, _buf) -> None:
+        self._desc_dirty = True
 
     def _on_steam_appid_changed(self, _row) -> None:
         steam_txt = self._steam_row.get_text().strip()
@@ -1449,7 +1475,6 @@ class MetadataEditorDialog(Adw.Dialog):
             return
         abs_path = chooser.get_file().get_path()
         if platform in ("linux", "dos"):
-            import os
             try:
                 formatted = os.path.relpath(abs_path, str(browse_root))
             except ValueError:
@@ -10,6 +10,7 @@ Steam tiles start unchecked; checking triggers download + inclusion on save.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import tempfile
 from dataclasses import dataclass
@@ -140,9 +141,11 @@ class ScreenshotGridWidget(Gtk.Box):
         start = len(self._local)
         for p in paths:
             self._local.append(ScreenshotItem(local_path=p))
+        # Local tiles sit before the Steam ones; insert only the new tiles
+        # there rather than rebuilding the whole grid.
         for i in range(start, len(self._local)):
             self._selected_local.add(i)
-        self._rebuild()
+            self._flow.insert(self._make_tile(self._local[i], "local", i), i)
         self._on_changed()
 
     def add_steam(self, steam_data: list[dict], *, notify: bool = True) -> None:
@@ -153,7 +156,7 @@ class ScreenshotGridWidget(Gtk.Box):
         Pass ``notify=False`` when restoring saved state to suppress the on_changed callback.
         """
         existing_filenames = {
-            Path(item.local_path).name
+            os.path.basename(item.local_path)
             for item in self._local
             if item.local_path
         }
@@ -175,7 +178,7 @@ class ScreenshotGridWidget(Gtk.Box):
                 continue
             if full_url in existing_steam_full or _url_base(full_url) in existing_source_bases:
                 continue
-            if Path(full_url.split("?")[0]).name in existing_filenames:
+            if os.path.basename(_url_base(full_url)) in existing_filenames:
                 continue
             item = ScreenshotItem(
                 local_path=None,
@@ -188,8 +191,10 @@ class ScreenshotGridWidget(Gtk.Box):
         if not added:
             return
 
+        start = len(self._steam)
         self._steam.extend(added)
-        self._rebuild()
+        for i in range(start, len(self._steam)):
+            self._flow.append(self._make_tile(self._steam[i], "steam", i))
         self._load_steam_thumbnails(added)
         if notify:
             self._on_changed()
@@ -301,11 +306,7 @@ class ScreenshotGridWidget(Gtk.Box):
     # ── FlowBox rebuild ───────────────────────────────────────────────────
 
     def _rebuild(self) -> None:
-        child = self._flow.get_first_child()
-        while child is not None:
-            nxt = child.get_next_sibling()
-            self._flow.remove(child)
-            child = nxt
+        self._flow.remove_all()
 
         for i, item in enumerate(self._local):
             self._flow.append(self._make_tile(item, "local", i))
@@ -321,6 +322,8 @@ class ScreenshotGridWidget(Gtk.Box):
             fbc.set_halign(Gtk.Align.START)
         fbc.add_css_class("ss-tile-cell")
         fbc._ss_item = item
+        fbc._ss_kind = kind
+        fbc._ss_idx = idx
 
         selected = (
             idx in self._selected_local if kind == "local"
@@ -364,24 +367,15 @@ class ScreenshotGridWidget(Gtk.Box):
             cloud_wrap.append(cloud_icon)
             overlay.add_overlay(cloud_wrap)
 
-        # Click to toggle selection on all tiles
+        # Click to toggle selection on all tiles.  The handlers are shared
+        # bound methods that read the tile's kind/index off the FlowBoxChild.
         gesture = Gtk.GestureClick()
-        gesture.connect(
-            "released",
-            lambda _g, _n, _x, _y, k=kind, i=idx: self._on_tile_clicked(k, i),
-        )
+        gesture.connect("released", self._on_tile_released)
         overlay.add_controller(gesture)
 
         # Keyboard: Space/Return toggles selection (HIG accessibility)
         key_ctrl = Gtk.EventControllerKey()
-        key_ctrl.connect(
-            "key-pressed",
-            lambda _c, kv, _code, _mod, k=kind, i=idx: (
-                self._on_tile_clicked(k, i) or True
-            )
-            if kv in (Gdk.KEY_space, Gdk.KEY_Return, Gdk.KEY_KP_Enter)
-            else False,
-        )
+        key_ctrl.connect("key-pressed", self._on_tile_key_pressed)
         fbc.add_controller(key_ctrl)
 
         fbc.set_child(overlay)
@@ -389,6 +383,17 @@ class ScreenshotGridWidget(Gtk.Box):
 
     # ── Selection ─────────────────────────────────────────────────────────
 
+    def _on_tile_released(self, gesture: Gtk.GestureClick, _n, _x, _y) -> None:
+        fbc = gesture.get_widget().get_parent()
+        self._on_tile_clicked(fbc._ss_kind, fbc._ss_idx)
+
+    def _on_tile_key_pressed(self, ctrl: Gtk.EventControllerKey, keyval, _code, _mod) -> bool:
+        if keyval not in (Gdk.KEY_space, Gdk.KEY_Return, Gdk.KEY_KP_Enter):
+            return False
+        fbc = ctrl.get_widget()
+        self._on_tile_clicked(fbc._ss_kind, fbc._ss_idx)
+        return True
+
     def _on_tile_clicked(self, kind: str, idx: int) -> None:
         sel = self._selected_local if kind == "local" else self._selected_steam
         if idx in sel:
@@ -399,33 +404,24 @@ class ScreenshotGridWidget(Gtk.Box):
         self._on_changed()
 
     def _refresh_tile_selection(self, kind: str, idx: int) -> None:
-        pool = self._local if kind == "local" else self._steam
         sel = self._selected_local if kind == "local" else self._selected_steam
         is_sel = idx in sel
 
-        child = self._flow.get_first_child()
-        while child is not None:
-            item = getattr(child, "_ss_item", None)
-            if item is not None:
-                c_kind = "steam" if item.is_steam else "local"
-                if c_kind == kind:
-                    try:
-                        c_idx = pool.index(item)
-                    except ValueError:
-                        child = child.get_next_sibling()
-                        continue
-                    if c_idx == idx:
-                        overlay = getattr(child, "_ss_overlay", None)
-                        check = getattr(child, "_ss_check", None)
-                        if overlay:
-                            if is_sel:
-                                overlay.add_css_class("selected")
-                            else:
-                                overlay.remove_css_class("selected")
-                        if check:
-                            check.set_visible(is_sel)
-                        break
-            child = child.get_next_sibling()
+        # Tiles are laid out local-first, then Steam, so the position is
+        # known without scanning the grid.
+        pos = idx if kind == "local" else len(self._local) + idx
+        child = self._flow.get_child_at_index(pos)
+        if child is None or getattr(child, "_ss_item", None) is None:
+            return
+        overlay = getattr(child, "_ss_overlay", None)
+        check = getattr(child, "_ss_check", None)
+        if overlay:
+            if is_sel:
+                overlay.add_css_class("selected")
+            else:
+                overlay.remove_css_class("selected")
+        if check:
+            check.set_visible(is_sel)
 
     # ── Browse ────────────────────────────────────────────────────────────
 
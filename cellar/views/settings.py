@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Collection
 from urllib.parse import urlparse
 
 import gi
@@ -43,7 +44,14 @@ class SettingsDialog(Adw.PreferencesDialog):
     ):
         super().__init__(title="Preferences", content_width=560, content_height=500, **kwargs)
         self._on_repos_changed = on_repos_changed
-        self._repo_rows: list[Adw.PreferencesRow] = []
+        # (repo config, row) pairs in display order.  A row is reused as
+        # long as its config dict is the same object as in the repo list.
+        self._repo_rows: list[tuple[dict, Adw.ActionRow]] = []
+        # In-memory copy of the repo list; loaded on first use and kept in
+        # step with every save so UI actions don't re-read the config file.
+        self._repos: list[dict] | None = None
+        self._repo_uris: set[str] = set()  # URIs in _repos, for duplicate checks
+        self._repo_sync_pending = False
 
         # ── Page: General ─────────────────────────────────────────────────
         page = Adw.PreferencesPage(
@@ -299,28 +307,25 @@ class SettingsDialog(Adw.PreferencesDialog):
     def _on_install_location_browse(self, _btn) -> None:
         from cellar.backend.config import load_install_base
 
-        chooser = Gtk.FileChooserNative(
-            title="Select Install Base Folder",
-            transient_for=self.get_root(),
-            action=Gtk.FileChooserAction.SELECT_FOLDER,
-        )
+        dialog = Gtk.FileDialog(title="Select Install Base Folder")
         current = load_install_base()
         start = current if current else str(Path.home())
-        chooser.set_current_folder(Gio.File.new_for_path(start))
-        chooser.connect("response", self._on_install_location_response, chooser)
-        chooser.show()
+        dialog.set_initial_folder(Gio.File.new_for_path(start))
+        dialog.select_folder(self.get_root(), None, self._on_install_location_response)
 
-    def _on_install_location_response(self, _chooser, response, chooser) -> None:
+    def _on_install_location_response(self, dialog, result) -> None:
         from cellar.backend.config import install_data_dir, save_install_base
 
-        if response == Gtk.ResponseType.ACCEPT:
-            f = chooser.get_file()
-            if f:
-                old_dir = install_data_dir()
-                save_install_base(f.get_path())
-                new_dir = install_data_dir()
-                self._install_location_row.set_subtitle(str(new_dir))
-                self._migrate_and_reload(old_dir, new_dir)
+        try:
+            f = dialog.select_folder_finish(result)
+        except GLib.Error:
+            return  # user cancelled
+        if f:
+            old_dir = install_data_dir()
+            save_install_base(f.get_path())
+            new_dir = install_data_dir()
+            self._install_location_row.set_subtitle(str(new_dir))
+            self._migrate_and_reload(old_dir, new_dir)
 
     def _on_install_location_reset(self, _btn) -> None:
         from cellar.backend.config import install_data_dir, save_install_base
@@ -425,15 +430,61 @@ class SettingsDialog(Adw.PreferencesDialog):
     # Repo list management
     # ------------------------------------------------------------------
 
+    def _get_repos(self) -> list[dict]:
+        """Return the configured repos, reading the config file only once."""
+        if self._repos is None:
+            self._repos = load_repos()
+            self._repo_uris = {r["uri"] for r in self._repos}
+        return self._repos
+
+    def _save_repos(self, repos: list[dict]) -> None:
+        """Persist *repos* and make them the new in-memory copy."""
+        save_repos(repos)
+        self._repos = repos
+        self._repo_uris = {r["uri"] for r in repos}
+
+    def _schedule_repo_sync(self) -> None:
+        """Refresh the rows and notify the window once the current burst of edits is done.
+
+        ``on_repos_changed`` reloads the main window's catalogue, so several
+        saves in quick succession are folded into a single low-priority pass.
+        """
+        if self._repo_sync_pending:
+            return
+        self._repo_sync_pending = True
+        GLib.idle_add(self._sync_repos, priority=GLib.PRIORITY_LOW)
+
+    def _sync_repos(self) -> bool:
+        self._repo_sync_pending = False
+        self._rebuild_repo_rows()
+        if self._on_repos_changed:
+            self._on_repos_changed()
+        return GLib.SOURCE_REMOVE
+
     def _rebuild_repo_rows(self) -> None:
-        """Sync the visible rows with the on-disk repo list."""
-        for row in self._repo_rows:
+        """Sync the visible rows with the repo list.
+
+        Saves replace a changed repo's config dict and leave the others
+        untouched, so only rows whose dict differs are rebuilt.  Rows after
+        the first change are detached and re-appended to keep the order,
+        since a preferences group can only append.
+        """
+        repos = self._get_repos()
+        rows = self._repo_rows
+        keep = 0
+        while keep < min(len(rows), len(repos)) and rows[keep][0] is repos[keep]:
+            keep += 1
+
+        detached = {id(cfg): (cfg, row) for cfg, row in rows[keep:]}
+        for _cfg, row in rows[keep:]:
             self._repo_group.remove(row)
-        self._repo_rows.clear()
+        del rows[keep:]
 
-        for repo_cfg in load_repos():
-            row = self._make_repo_row(repo_cfg)
-            self._repo_rows.append(row)
+        for repo_cfg in repos[keep:]:
+            cfg, row = detached.get(id(repo_cfg), (None, None))
+            if cfg is not repo_cfg:
+                row = self._make_repo_row(repo_cfg)
+            rows.append((repo_cfg, row))
             self._repo_group.add(row)
 
     def _make_repo_row(self, repo_cfg: dict) -> Adw.ActionRow:
@@ -511,7 +562,7 @@ class SettingsDialog(Adw.PreferencesDialog):
             has_frame=False,
             tooltip_text="Edit repository",
         )
-        edit_btn.connect("clicked", self._on_edit_repo, repo_cfg)
+        edit_btn.connect("clicked", self._on_edit_repo, uri)
         row.add_suffix(edit_btn)
 
         del_btn = Gtk.Button(
@@ -533,12 +584,21 @@ class SettingsDialog(Adw.PreferencesDialog):
         enabled = switch.get_active()
         repos = [
             {**r, "enabled": enabled} if r["uri"] == uri else r
-            for r in load_repos()
+            for r in self._get_repos()
         ]
-        save_repos(repos)
-        self._rebuild_repo_rows()
-        if self._on_repos_changed:
-            self._on_repos_changed()
+        self._save_repos(repos)
+        # Only the dimming depends on the flag, so point the existing row at
+        # the new config instead of building a fresh one.
+        new_cfg = next(r for r in repos if r["uri"] == uri)
+        for i, (cfg, row) in enumerate(self._repo_rows):
+            if cfg["uri"] == uri:
+                self._repo_rows[i] = (new_cfg, row)
+                if enabled:
+                    row.remove_css_class("dim-label")
+                else:
+                    row.add_css_class("dim-label")
+                break
+        self._schedule_repo_sync()
 
     # ------------------------------------------------------------------
     # Add / Edit handlers
@@ -546,31 +606,28 @@ class SettingsDialog(Adw.PreferencesDialog):
 
     def _on_add_clicked(self, _btn: Gtk.Button) -> None:
         def _save(cfg: dict) -> None:
-            repos = load_repos()
-            repos.append(cfg)
-            save_repos(repos)
-            self._rebuild_repo_rows()
-            if self._on_repos_changed:
-                self._on_repos_changed()
+            self._save_repos([*self._get_repos(), cfg])
+            self._schedule_repo_sync()
 
-        dialog = AddEditRepoDialog(on_save=_save)
+        dialog = AddEditRepoDialog(on_save=_save, known_uris=self._repo_uris)
         dialog.present(self)
 
-    def _on_edit_repo(self, _btn: Gtk.Button, repo_cfg: dict) -> None:
-        old_uri = repo_cfg["uri"]
+    def _on_edit_repo(self, _btn: Gtk.Button, old_uri: str) -> None:
+        # Look the config up now: the row may outlive the dict it was built
+        # from (e.g. after its enabled switch is toggled).
+        repo_cfg = next(r for r in self._get_repos() if r["uri"] == old_uri)
 
         def _save(cfg: dict) -> None:
-            repos = load_repos()
-            for i, r in enumerate(repos):
-                if r["uri"] == old_uri:
-                    repos[i] = cfg
-                    break
-            save_repos(repos)
-            self._rebuild_repo_rows()
-            if self._on_repos_changed:
-                self._on_repos_changed()
-
-        dialog = AddEditRepoDialog(on_save=_save, existing=repo_cfg)
+            self._save_repos([
+                cfg if r["uri"] == old_uri else r for r in self._get_repos()
+            ])
+            self._schedule_repo_sync()
+
+        dialog = AddEditRepoDialog(
+            on_save=_save,
+            existing=repo_cfg,
+            known_uris=self._repo_uris,
+        )
         dialog.present(self)
 
     # ------------------------------------------------------------------
@@ -593,15 +650,12 @@ class SettingsDialog(Adw.PreferencesDialog):
         def _on_response(_dlg: Adw.AlertDialog, response: str) -> None:
             if response != "remove":
                 return
-            repos = [r for r in load_repos() if r["uri"] != uri]
-            save_repos(repos)
+            self._save_repos([r for r in self._get_repos() if r["uri"] != uri])
             clear_password(uri)
             from cellar.backend.repo import Repo
             Repo.clear_catalogue_cache(uri)
             Repo.clear_asset_cache(uri)
-            self._rebuild_repo_rows()
-            if self._on_repos_changed:
-                self._on_repos_changed()
+            self._schedule_repo_sync()
 
         dlg.connect("response", _on_response)
         dlg.present(self)
@@ -632,6 +686,7 @@ class AddEditRepoDialog(Adw.Dialog):
     Pass ``existing=None`` for "Add" mode, or ``existing=<repo-cfg-dict>``
     for "Edit" mode.  ``on_save`` is called with the validated repo config
     dict on success; closing the dialog without saving does nothing.
+    ``known_uris`` lists the URIs already configured, for the duplicate check.
     """
 
     def __init__(
@@ -639,12 +694,16 @@ class AddEditRepoDialog(Adw.Dialog):
         *,
         on_save: Callable[[dict], None],
         existing: dict | None = None,
+        known_uris: Collection[str] = (),
     ) -> None:
         mode = "Edit Repository" if existing else "Add Repository"
         super().__init__(title=mode, content_width=480, follows_content_size=True)
         self._on_save = on_save
         self._existing = existing
+        self._known_uris = known_uris
         self._ca_cert_path: str | None = None
+        # Built when the certificate picker is first opened, then reused.
+        self._cert_filters: Gio.ListStore | None = None
         if existing and existing.get("ca_cert"):
             self._ca_cert_path = existing["ca_cert"]
         self._build_ui()
@@ -858,27 +917,28 @@ class AddEditRepoDialog(Adw.Dialog):
         self._ca_row.set_visible(row.get_active())
 
     def _on_select_ca_cert(self, _btn: Gtk.Button) -> None:
+        if self._cert_filters is None:
+            f = Gtk.FileFilter()
+            f.set_name("Certificate files (*.crt, *.pem, *.cer)")
+            f.add_pattern("*.crt")
+            f.add_pattern("*.pem")
+            f.add_pattern("*.cer")
+            self._cert_filters = Gio.ListStore.new(Gtk.FileFilter)
+            self._cert_filters.append(f)
+        dialog = Gtk.FileDialog(title="Select CA Certificate", filters=self._cert_filters)
         root = self.get_root()
-        chooser = Gtk.FileChooserNative(
-            title="Select CA Certificate",
-            transient_for=root if isinstance(root, Gtk.Window) else None,
-            action=Gtk.FileChooserAction.OPEN,
+        dialog.open(
+            root if isinstance(root, Gtk.Window) else None,
+            None,
+            self._on_ca_cert_chosen,
         )
-        f = Gtk.FileFilter()
-        f.set_name("Certificate files (*.crt, *.pem, *.cer)")
-        f.add_pattern("*.crt")
-        f.add_pattern("*.pem")
-        f.add_pattern("*.cer")
-        chooser.add_filter(f)
-        chooser.connect("response", self._on_ca_cert_chosen, chooser)
-        chooser.show()
-
-    def _on_ca_cert_chosen(
-        self, _chooser, response: int, chooser: Gtk.FileChooserNative
-    ) -> None:
-        if response != Gtk.ResponseType.ACCEPT:
-            return
-        path = chooser.get_file().get_path()
+
+    def _on_ca_cert_chosen(self, dialog: Gtk.FileDialog, result: Gio.AsyncResult) -> None:
+        try:
+            file = dialog.open_finish(result)
+        except GLib.Error:
+            return  # user cancelled
+        path = file.get_path() if file else None
         if path:
             self._ca_cert_path = path
             self._ca_row.set_subtitle(Path(path).name)
@@ -904,7 +964,7 @@ class AddEditRepoDialog(Adw.Dialog):
 
         # Duplicate check — only if URI is new.
         old_uri = self._existing.get("uri") if self._existing else None
-        if uri != old_uri and any(r["uri"] == uri for r in load_repos()):
+        if uri != old_uri and uri in self._known_uris:
             self._alert("Already Added", "This repository is already in the list.")
             return
 
@@ -948,79 +1008,118 @@ class AddEditRepoDialog(Adw.Dialog):
                 self._alert("Invalid Repository", err)
             return
 
-        try:
-            repo.fetch_catalogue(use_cache=False)
-        except RepoError as exc:
-            err = str(exc)
-            if _looks_like_missing(err):
-                if repo.is_writable:
-                    self._ask_init(
-                        uri, name, token, ssl_verify,
-                        smb_username, smb_password, ssh_username, ssh_password,
-                    )
-                else:
-                    self._alert(
-                        "No Catalogue Found",
-                        f"No catalogue.json was found at:\n\n{uri}\n\n"
-                        "HTTP repositories are read-only — the catalogue must "
-                        "already exist on the server.",
-                    )
-            elif _looks_like_auth_error(err):
-                if token:
-                    self._alert(
-                        "Authentication Failed",
-                        "The token was rejected. Check that it matches your "
-                        "web server configuration.",
-                    )
-                else:
-                    self._alert(
-                        "Authentication Required",
-                        "This repository requires a bearer token. "
-                        "Enter it in the Access token field and try again.",
-                    )
-            elif _looks_like_forbidden_error(err):
-                self._alert(
-                    "Access Denied",
-                    "The server returned 403 Forbidden. "
-                    "If this repository uses bearer token authentication, "
-                    "check that the token is correct.\n\n"
-                    "If you manage the server, verify the web server "
-                    "configuration — see the README for a working nginx "
-                    "example.",
+        # The fetch is a network round-trip; keep it off the main thread.
+        from cellar.utils.async_work import run_in_background
+
+        def _fetch() -> str | None:
+            try:
+                repo.fetch_catalogue(use_cache=False)
+            except RepoError as exc:
+                return str(exc)
+            return None
+
+        def _fetched(err: str | None) -> None:
+            self._save_btn.set_sensitive(True)
+            if err is not None:
+                self._on_fetch_failed(
+                    err, repo.is_writable, uri, name, token, ssl_verify,
+                    smb_username, smb_password, ssh_username, ssh_password,
                 )
-            elif _looks_like_ssl_error(err):
-                self._alert(
-                    "SSL Certificate Error",
-                    f"The server at {uri} presented a certificate that could not "
-                    "be verified. Provide your CA certificate file using the "
-                    "CA Certificate field above, or disable SSL verification.",
+                return
+
+            # Copy CA cert into certs_dir if it's a newly selected file.
+            if ca_cert_path and ca_cert_name:
+                import shutil
+                src = Path(ca_cert_path)
+                dest = certs_dir() / ca_cert_name
+                if not dest.exists():
+                    # copyfile takes the kernel fast-copy path (sendfile) on
+                    # Linux; a cert needs none of the metadata copy2 adds.
+                    shutil.copyfile(src, dest)
+
+            self._finish_save(
+                uri, name, token, ssl_verify, ca_cert_name,
+                smb_username, smb_password, ssh_username, ssh_password,
+            )
+
+        def _failed(err: str) -> None:
+            self._save_btn.set_sensitive(True)
+            self._alert("Could Not Connect", err)
+
+        self._save_btn.set_sensitive(False)
+        run_in_background(_fetch, on_done=_fetched, on_error=_failed)
+
+    def _on_fetch_failed(
+        self,
+        err: str,
+        writable: bool,
+        uri: str,
+        name: str,
+        token: str | None,
+        ssl_verify: bool,
+        smb_username: str | None = None,
+        smb_password: str | None = None,
+        ssh_username: str | None = None,
+        ssh_password: str | None = None,
+    ) -> None:
+        """Explain why the catalogue at *uri* could not be fetched."""
+        is_smb = urlparse(uri).scheme.lower() == "smb"
+        low = err.lower()
+        if _looks_like_missing(err, low):
+            if writable:
+                self._ask_init(
+                    uri, name, token, ssl_verify,
+                    smb_username, smb_password, ssh_username, ssh_password,
                 )
-            elif is_smb and _looks_like_smb_auth_error(err):
-                cred_hint = (
-                    "Enter your username and password in the SMB Credentials section above."
-                    if not smb_username
-                    else "Check that your username and password are correct."
+            else:
+                self._alert(
+                    "No Catalogue Found",
+                    f"No catalogue.json was found at:\n\n{uri}\n\n"
+                    "HTTP repositories are read-only — the catalogue must "
+                    "already exist on the server.",
                 )
+        elif _looks_like_auth_error(err):
+            if token:
                 self._alert(
-                    "SMB Access Denied",
-                    f"Access to {uri} was denied by the SMB server.\n\n{cred_hint}",
+                    "Authentication Failed",
+                    "The token was rejected. Check that it matches your "
+                    "web server configuration.",
                 )
             else:
-                self._alert("Could Not Connect", err)
-            return
-
-        # Copy CA cert into certs_dir if it's a newly selected file.
-        if ca_cert_path and ca_cert_name:
-            import shutil
-            src = Path(ca_cert_path)
-            dest = certs_dir() / ca_cert_name
-            if not dest.exists():
-                shutil.copy2(src, dest)
-
-        self._finish_save(
-            uri, name, token, ssl_verify, ca_cert_name,
-            smb_username, smb_password, ssh_username, ssh_password,
-        )
+                self._alert(
+                    "Authentication Required",
+                    "This repository requires a bearer token. "
+                    "Enter it in the Access token field and try again.",
+                )
+        elif _looks_like_forbidden_error(err):
+            self._alert(
+                "Access Denied",
+                "The server returned 403 Forbidden. "
+                "If this repository uses bearer token authentication, "
+                "check that the token is correct.\n\n"
+                "If you manage the server, verify the web server "
+                "configuration — see the README for a working nginx "
+                "example.",
+            )
+        elif _looks_like_ssl_error(err, low):
+            self._alert(
+                "SSL Certificate Error",
+                f"The server at {uri} presented a certificate that could not "
+                "be verified. Provide your CA certificate file using the "
+                "CA Certificate field above, or disable SSL verification.",
+            )
+        elif is_smb and _looks_like_smb_auth_error(err, low):
+            cred_hint = (
+                "Enter your username and password in the SMB Credentials section above."
+                if not smb_username
+                else "Check that your username and password are correct."
+            )
+            self._alert(
+                "SMB Access Denied",
+                f"Access to {uri} was denied by the SMB server.\n\n{cred_hint}",
+            )
+        else:
+            self._alert("Could Not Connect", err)
 
     # ------------------------------------------------------------------
     # Init flow (catalogue missing on a writable repo)
@@ -1104,10 +1203,7 @@ class AddEditRepoDialog(Adw.Dialog):
         target = Path(parsed.path if parsed.path else uri).expanduser()
         try:
             target.mkdir(parents=True, exist_ok=True)
-            (target / "catalogue.json").write_text(
-                json.dumps(_empty_catalogue(), indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            (target / "catalogue.json").write_bytes(_empty_catalogue_bytes())
             log.info("Initialised new repo at %s", target)
         except OSError as exc:
             self._alert("Could Not Initialise", str(exc))
@@ -1132,7 +1228,7 @@ class AddEditRepoDialog(Adw.Dialog):
 
         unc = smb_uri_to_unc(uri)
         cat_unc = unc.rstrip("/") + "/catalogue.json"
-        data = json.dumps(_empty_catalogue(), indent=2, ensure_ascii=False).encode()
+        data = _empty_catalogue_bytes()
         server = urlparse(uri).hostname or ""
         try:
             import smbclient  # type: ignore[import]
@@ -1142,9 +1238,17 @@ class AddEditRepoDialog(Adw.Dialog):
             if smb_password:
                 kwargs["password"] = smb_password
             smbclient.register_session(server, **kwargs)
-            smbclient.makedirs(unc, exist_ok=True)
-            with smbclient.open_file(cat_unc, mode="wb") as f:
-                f.write(data)
+            # The share directory usually exists already, so write first and
+            # only walk the path with makedirs when the write says it's missing.
+            try:
+                with smbclient.open_file(cat_unc, mode="wb") as f:
+                    f.write(data)
+            except OSError as exc:
+                if not _looks_like_missing(str(exc)):
+                    raise
+                smbclient.makedirs(unc, exist_ok=True)
+                with smbclient.open_file(cat_unc, mode="wb") as f:
+                    f.write(data)
             log.info("Initialised new SMB repo at %s", uri)
         except ImportError:
             self._alert(
@@ -1198,25 +1302,38 @@ class AddEditRepoDialog(Adw.Dialog):
             port=parsed.port,
             password=ssh_password,
         )
-        try:
-            root.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            self._alert("Could Not Initialise", str(exc))
-            return
 
-        cat_path = root / "catalogue.json"
-        data = json.dumps(_empty_catalogue(), indent=2, ensure_ascii=False)
-        try:
-            cat_path.write_text(data)
-        except OSError as exc:
-            self._alert("Could Not Initialise", f"Could not write catalogue.json: {exc}")
-            return
+        # Connecting can take up to the SSH timeout; keep it off the main thread.
+        from cellar.utils.async_work import run_in_background
 
-        log.info("Initialised new SFTP repo at %s", uri)
-        self._finish_save(
-            uri, name, token, ssl_verify, None,
-            smb_username, smb_password, ssh_username, ssh_password,
-        )
+        def _init() -> str | None:
+            try:
+                root.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                return str(exc)
+            try:
+                (root / "catalogue.json").write_bytes(_empty_catalogue_bytes())
+            except OSError as exc:
+                return f"Could not write catalogue.json: {exc}"
+            return None
+
+        def _done(err: str | None) -> None:
+            self._save_btn.set_sensitive(True)
+            if err is not None:
+                self._alert("Could Not Initialise", err)
+                return
+            log.info("Initialised new SFTP repo at %s", uri)
+            self._finish_save(
+                uri, name, token, ssl_verify, None,
+                smb_username, smb_password, ssh_username, ssh_password,
+            )
+
+        def _failed(err: str) -> None:
+            self._save_btn.set_sensitive(True)
+            self._alert("Could Not Initialise", err)
+
+        self._save_btn.set_sensitive(False)
+        run_in_background(_init, on_done=_done, on_error=_failed)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -1318,49 +1435,67 @@ def _move_install_data(old_dir: Path, new_dir: Path) -> None:
     database.update_install_paths(str(old_dir), str(new_dir))
 
 
-def _empty_catalogue() -> dict:
-    return {
-        "cellar_version": 1,
-        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "apps": [],
-    }
+# An empty catalogue as json.dumps(..., indent=2) lays it out; only the
+# timestamp varies between repos.
+_EMPTY_CATALOGUE_TEMPLATE = json.dumps(
+    {"cellar_version": 1, "generated_at": "{ts}", "apps": []}, indent=2,
+)
+
+
+def _empty_catalogue_bytes() -> bytes:
+    """Return a freshly timestamped empty ``catalogue.json``, ready to write."""
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _EMPTY_CATALOGUE_TEMPLATE.replace("{ts}", ts, 1).encode("ascii")
 
 
 def _is_local_uri(uri: str) -> bool:
     return urlparse(uri).scheme.lower() in ("", "file")
 
 
-def _looks_like_missing(err: str) -> bool:
+def _keyword_re(*keywords: str) -> re.Pattern[str]:
+    """Compile one alternation matching any of *keywords* literally."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Substrings (lower-case) the error heuristics below look for.
+_MISSING_RE = _keyword_re(
+    "not found", "does not exist", "no such file",
+    "cannot find", "path not found", "object name not found",
+    "object path not found",
+)
+_SMB_AUTH_RE = _keyword_re(
+    "access denied", "access_denied", "permission denied",
+    "logon failure", "wrong password", "bad password",
+    "status_access_denied", "status_logon_failure",
+    "authentication", "0xc000006d", "0xc0000022", "0xc000006e",
+)
+_SSL_RE = _keyword_re("ssl", "certificate", "cert_verify", "handshake")
+
+
+def _looks_like_missing(err: str, low: str | None = None) -> bool:
     """Heuristic: does this look like a missing file rather than an auth/network error?
 
     Mount failures (e.g. "Failed to mount Windows share: No such file or
     directory") also contain "no such file", so explicitly exclude them.
+
+    Callers classifying one error several ways can pass *low*, the
+    already lower-cased *err*, to save re-lowering it for each check.
     """
-    low = err.lower()
+    if low is None:
+        low = err.lower()
     if "mount" in low:
         return False
-    return any(kw in low for kw in (
-        "not found", "does not exist", "no such file",
-        "cannot find", "path not found", "object name not found",
-        "object path not found",
-    ))
+    return _MISSING_RE.search(low) is not None
 
 
-def _looks_like_smb_auth_error(err: str) -> bool:
+def _looks_like_smb_auth_error(err: str, low: str | None = None) -> bool:
     """Heuristic: does this look like an SMB authentication or access-denied failure?"""
-    low = err.lower()
-    return any(kw in low for kw in (
-        "access denied", "access_denied", "permission denied",
-        "logon failure", "wrong password", "bad password",
-        "status_access_denied", "status_logon_failure",
-        "authentication", "0xc000006d", "0xc0000022", "0xc000006e",
-    ))
+    return _SMB_AUTH_RE.search(err.lower() if low is None else low) is not None
 
 
-def _looks_like_ssl_error(err: str) -> bool:
+def _looks_like_ssl_error(err: str, low: str | None = None) -> bool:
     """Heuristic: does this look like an SSL certificate verification failure?"""
-    low = err.lower()
-    return any(kw in low for kw in ("ssl", "certificate", "cert_verify", "handshake"))
+    return _SSL_RE.search(err.lower() if low is None else low) is not None
 
 
 def _looks_like_auth_error(err: str) -> bool:
@@ -7,8 +7,11 @@ from typing import Callable
 import gi
 
 gi.require_version("Gtk", "4.0")
+gi.require_version("Gdk", "4.0")
+gi.require_version("Gsk", "4.0")
+gi.require_version("Graphene", "1.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, Gtk, Pango
+from gi.repository import Adw, Gdk, Gio, Graphene, Gsk, Gtk, Pango
 
 # ---------------------------------------------------------------------------
 # Card layout constants (GNOME Software-style horizontal cards)
@@ -23,6 +26,10 @@ ICON_MARGIN = 22  # px from left edge — matches vertical centering: (96-52)/2
 CAPSULE_WIDTH = 200
 CAPSULE_HEIGHT = 300
 
+# Generic app icon shared by every card/header without artwork (and used as
+# the placeholder while artwork loads), so it is resolved once, not per use.
+FALLBACK_APP_GICON = Gio.ThemedIcon.new("application-x-executable")
+
 
 # ---------------------------------------------------------------------------
 # FixedBox — single-child container with a hard-coded natural size
@@ -69,6 +76,68 @@ class FixedBox(Gtk.Box):
             child.allocate(width, height, baseline, None)
 
 
+# ---------------------------------------------------------------------------
+# TextureBox — fixed-size widget that draws a texture directly
+# ---------------------------------------------------------------------------
+
+
+class TextureBox(Gtk.Widget):
+    """Fixed-size leaf widget that snapshots a ``Gdk.Texture`` itself.
+
+    Stands in for a :class:`FixedBox` wrapping a ``Gtk.Picture`` for card
+    artwork: one widget per image instead of two, and no content-fit
+    machinery.  With *cover* the texture is scaled to fill the box and
+    cropped (like ``Gtk.ContentFit.COVER``); otherwise it is scaled down to
+    fit and centred (like ``Gtk.ContentFit.SCALE_DOWN``).
+    """
+
+    __gtype_name__ = "CellarTextureBox"
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        texture: Gdk.Texture | None = None,
+        *,
+        cover: bool = False,
+    ) -> None:
+        super().__init__()
+        self._w = width
+        self._h = height
+        self._cover = cover
+        self._texture = texture
+
+    def set_texture(self, texture: Gdk.Texture | None) -> None:
+        self._texture = texture
+        self.queue_draw()
+
+    def do_measure(self, orientation, for_size):
+        size = self._w if orientation == Gtk.Orientation.HORIZONTAL else self._h
+        return size, size, -1, -1
+
+    def do_snapshot(self, snapshot: Gtk.Snapshot) -> None:
+        texture = self._texture
+        if texture is None:
+            return
+        w, h = self.get_width(), self.get_height()
+        tw, th = texture.get_width(), texture.get_height()
+        if not (w and h and tw and th):
+            return
+        # Textures are decoded in device pixels, so "scale down" compares
+        # against the full texture size rather than assuming 1:1.
+        if self._cover:
+            scale = max(w / tw, h / th)
+        else:
+            scale = min(w / tw, h / th, 1.0)
+        dw, dh = tw * scale, th * scale
+        bounds = Graphene.Rect().init((w - dw) / 2, (h - dh) / 2, dw, dh)
+        if self._cover:
+            snapshot.push_clip(Graphene.Rect().init(0, 0, w, h))
+        snapshot.append_scaled_texture(texture, Gsk.ScalingFilter.TRILINEAR, bounds)
+        if self._cover:
+            snapshot.pop()
+
+
 # ---------------------------------------------------------------------------
 # BaseCard — shared card shell for app/project/catalogue cards
 # ---------------------------------------------------------------------------
@@ -150,7 +219,19 @@ class BaseCard(Gtk.FlowBoxChild):
 
 def make_card_icon_from_name(icon_name: str, *, dim: bool = False) -> Gtk.Image:
     """Create a themed icon widget sized for a card."""
-    icon = Gtk.Image.new_from_icon_name(icon_name)
+    return _style_card_icon(Gtk.Image.new_from_icon_name(icon_name), dim=dim)
+
+
+def make_card_icon_from_gicon(gicon: Gio.Icon, *, dim: bool = False) -> Gtk.Image:
+    """Create a card-sized icon widget from a shared :class:`Gio.Icon`.
+
+    Lets callers that build many cards reuse one icon object instead of
+    resolving the same icon name per card.
+    """
+    return _style_card_icon(Gtk.Image.new_from_gicon(gicon), dim=dim)
+
+
+def _style_card_icon(icon: Gtk.Image, *, dim: bool) -> Gtk.Image:
     icon.set_pixel_size(ICON_SIZE)
     icon.set_halign(Gtk.Align.CENTER)
     icon.set_valign(Gtk.Align.CENTER)
@@ -250,6 +250,9 @@ class CellarWindow(Adw.ApplicationWindow):
         # Track which popover is active so we can rebuild on tab switch.
         self._browse_filter_entries: list = []
         self._browse_filter_repos: list | None = None
+        # Built browse popover, reused (with its check-button state) when
+        # switching tabs instead of being rebuilt from the entry list.
+        self._browse_filter_popover: Gtk.Popover | None = None
 
         # No custom child — let the GtkMenuButton use its icon-name from the
         # .ui file so it renders with standard headerbar flat styling.
@@ -640,6 +643,7 @@ class CellarWindow(Adw.ApplicationWindow):
         popover = Gtk.Popover()
         popover.set_child(outer)
         self.filter_button.set_popover(popover)
+        self._browse_filter_popover = popover
 
     def _set_filter_active(self, active: bool) -> None:
         """Toggle accent styling on the filter button."""
@@ -655,6 +659,8 @@ class CellarWindow(Adw.ApplicationWindow):
         )
 
     def _on_category_toggled(self, btn: Gtk.CheckButton, category: str) -> None:
+        if btn.get_active() == (category in self._active_categories):
+            return  # already in that state, e.g. reset by _on_filter_clear
         if btn.get_active():
             self._active_categories.add(category)
         else:
@@ -666,6 +672,8 @@ class CellarWindow(Adw.ApplicationWindow):
         self._browse_updates.set_active_categories(active)
 
     def _on_repo_toggled(self, btn: Gtk.CheckButton, repo_uri: str) -> None:
+        if btn.get_active() == (repo_uri in self._active_repos):
+            return  # already in that state, e.g. reset by _on_filter_clear
         if btn.get_active():
             self._active_repos.add(repo_uri)
         else:
@@ -677,6 +685,8 @@ class CellarWindow(Adw.ApplicationWindow):
         self._browse_updates.set_active_repos(active)
 
     def _on_genre_toggled(self, btn: Gtk.CheckButton, genre: str) -> None:
+        if btn.get_active() == (genre in self._active_genres):
+            return  # already in that state, e.g. reset by _on_filter_clear
         if btn.get_active():
             self._active_genres.add(genre)
         else:
@@ -688,6 +698,8 @@ class CellarWindow(Adw.ApplicationWindow):
         self._browse_updates.set_active_genres(active)
 
     def _on_platform_toggled(self, btn: Gtk.CheckButton, platform: str) -> None:
+        if btn.get_active() == (platform in self._active_platforms):
+            return  # already in that state, e.g. reset by _on_filter_clear
         if btn.get_active():
             self._active_platforms.add(platform)
         else:
@@ -699,6 +711,12 @@ class CellarWindow(Adw.ApplicationWindow):
         self._browse_updates.set_active_platforms(active)
 
     def _on_filter_clear(self, _button: Gtk.Button) -> None:
+        # Reset the sets first so the toggled handlers see no state change
+        # and don't run a filter pass per unticked button.
+        self._active_categories = set()
+        self._active_repos = set()
+        self._active_genres = set()
+        self._active_platforms = set()
         for btn in self._category_btns.values():
             btn.set_active(False)
         for btn in self._repo_btns.values():
@@ -707,10 +725,6 @@ class CellarWindow(Adw.ApplicationWindow):
             btn.set_active(False)
         for btn in self._platform_btns.values():
             btn.set_active(False)
-        self._active_categories = set()
-        self._active_repos = set()
-        self._active_genres = set()
-        self._active_platforms = set()
         self._set_filter_active(False)
         self._browse_explore.set_active_categories(set())
         self._browse_installed.set_active_categories(set())
@@ -737,6 +751,11 @@ class CellarWindow(Adw.ApplicationWindow):
 
     def _rebuild_browse_filter_popover(self) -> None:
         """Restore the browse-tab filter popover."""
+        if self._browse_filter_popover is not None:
+            if self.filter_button.get_popover() is not self._browse_filter_popover:
+                self.filter_button.set_popover(self._browse_filter_popover)
+            self._set_filter_active(self._any_filter_active())
+            return
         self._rebuild_filter_popover(
             self._browse_filter_entries, self._browse_filter_repos
         )
@@ -0,0 +1,58 @@
+"""Tests for cellar.backend.config — repo list persistence."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Allow running from the repo root without installing the package.
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from cellar.backend import config
+
+
+@pytest.fixture(autouse=True)
+def data_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    monkeypatch.setattr(config, "_repos_cache", None)
+    return tmp_path
+
+
+def test_load_repos_without_config_is_empty():
+    assert config.load_repos() == []
+
+
+def test_save_and_load_repos_round_trip():
+    repos = [{"uri": "/srv/cellar", "name": "Local"}, {"uri": "https://example.com/repo"}]
+    config.save_repos(repos)
+    assert config.load_repos() == repos
+
+
+def test_load_repos_returns_independent_copies():
+    config.save_repos([{"uri": "/srv/cellar"}])
+    first = config.load_repos()
+    first[0]["name"] = "Changed"
+    first.append({"uri": "/other"})
+    assert config.load_repos() == [{"uri": "/srv/cellar"}]
+
+
+def test_load_repos_picks_up_external_changes(data_home):
+    config.save_repos([{"uri": "/srv/cellar"}])
+    assert config.load_repos() == [{"uri": "/srv/cellar"}]
+
+    path = data_home / "cellar" / "config.json"
+    path.write_text(json.dumps({"repos": [{"uri": "/srv/other"}, {"uri": "/srv/third"}]}))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert config.load_repos() == [{"uri": "/srv/other"}, {"uri": "/srv/third"}]
+
+
+def test_save_repos_preserves_other_keys(data_home):
+    config.save_install_base("/mnt/games")
+    config.save_repos([{"uri": "/srv/cellar"}])
+    raw = json.loads((data_home / "cellar" / "config.json").read_text())
+    assert raw["install_base"] == "/mnt/games"
+    assert raw["repos"] == [{"uri": "/srv/cellar"}]